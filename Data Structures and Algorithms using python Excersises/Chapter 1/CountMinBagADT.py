@@ -0,0 +1,175 @@
+"""
+An approximate Counting Bag that uses a fixed amount of memory, however many
+distinct items are added. It has the add, num_of and size operations of the
+CountingBag in CountingBagADT.py.
+
+The counts are kept in a Count-Min Sketch: a table of depth rows of width
+counters. Each row maps an item to one of its counters with a different hash
+function. Adding an item increases its counter in every row, and num_of returns
+the smallest of those counters. Other items sharing a counter can only make it
+larger, so num_of never underestimates, and with width = ceil(e / error) and
+depth = ceil(ln(1 / (1 - confidence))) it overestimates by at most
+error * size() with the given confidence.
+
+The hash functions are derived from blake2b rather than hash(), so they are
+the same in every process. Two bags built with the same error, confidence and
+seed can therefore be merged by adding their tables, e.g. to combine counts
+gathered by several shards.
+
+To hash an item the same way in every process it needs a canonical byte
+encoding, so items must be str, bytes, int, float, None or tuples of these.
+A bool or a float with an integral value counts as the int it equals, as in
+CountingBag. Other types, such as frozensets or objects with the default
+repr, raise TypeError.
+"""
+import math
+import struct
+from array import array
+from collections import Counter
+from hashlib import blake2b
+from itertools import islice
+
+# update counts the items of an iterable in chunks of this many, so it uses a
+# bounded amount of memory however many distinct items the iterable holds.
+_UPDATE_CHUNK = 4096
+
+class CountMinBag:
+    """
+    Initialize an empty approximate Counting Bag.
+
+    Parameters:
+    error (float): The largest overestimate of num_of, as a fraction of size().
+    confidence (float): The probability that num_of is within the error bound.
+    seed (int): Selects the hash functions; bags can only be merged with the same seed.
+
+    Returns:
+    None
+    """
+    def __init__(self, error=0.001, confidence=0.99, seed=0):
+        assert 0 < error < 1, "The error must be between 0 and 1."
+        assert 0 < confidence < 1, "The confidence must be between 0 and 1."
+        self.width = math.ceil(math.e / error)
+        self.depth = math.ceil(math.log(1 / (1 - confidence)))
+        self.seed = seed
+        self._key = seed.to_bytes(8, "little")
+        self._counts = array("Q", bytes(8 * self.width * self.depth))
+        self._total = 0
+
+    def add(self, item, n=1):
+        """Add n occurrences of item to the bag."""
+        assert n >= 0, "The number of occurrences must be >= 0."
+        counts = self._counts
+        for ndx in self._slots(item):
+            counts[ndx] += n
+        self._total += n
+
+    def update(self, iterable):
+        """Add one occurrence of every item in iterable to the bag."""
+        # Hash each distinct item of a chunk only once.
+        iterator = iter(iterable)
+        while True:
+            chunk = Counter(islice(iterator, _UPDATE_CHUNK))
+            if not chunk:
+                break
+            for item, count in chunk.items():
+                self.add(item, count)
+
+    def merge(self, other):
+        """Add all the occurrences counted by another CountMinBag to this bag."""
+        assert (self.width, self.depth, self.seed) == (other.width, other.depth, other.seed), \
+               "Only bags with the same error, confidence and seed can be merged."
+        counts = self._counts
+        for ndx, count in enumerate(other._counts):
+            if count:
+                counts[ndx] += count
+        self._total += other._total
+
+    def is_empty(self):
+        return self._total == 0
+
+    def size(self):
+        return self._total
+
+    def num_of(self, item):
+        counts = self._counts
+        return min(counts[ndx] for ndx in self._slots(item))
+
+    def memory_size(self):
+        """Return the number of bytes used by the counters."""
+        return self._counts.itemsize * len(self._counts)
+
+    def _slots(self, item):
+        # Two 64-bit hashes h1 and h2 give row i the hash h1 + i * h2
+        # (double hashing), so one blake2b digest serves every row.
+        digest = blake2b(_itemBytes(item), digest_size=16, key=self._key).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def __str__(self):
+        return f"CountMinBag(size={self._total}, width={self.width}, depth={self.depth})"
+
+
+# Returns a byte string that identifies an item in every process.
+def _itemBytes(item):
+    encoded = bytearray()
+    _encodeItem(item, encoded)
+    return bytes(encoded)
+
+# Appends a type tag, a length and the payload of an item to encoded. The
+# lengths keep the encodings of the parts of a tuple from running together.
+def _encodeItem(item, encoded):
+    if isinstance(item, bytes):
+        tag, payload = b"b", item
+    elif isinstance(item, str):
+        tag, payload = b"s", item.encode("utf-8")
+    elif isinstance(item, int) or (isinstance(item, float) and item.is_integer()):
+        # An integral float such as 2.0 or -0.0 equals an int, so it must hash like one.
+        item = int(item)
+        tag, payload = b"i", item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+    elif isinstance(item, float):
+        tag, payload = b"f", struct.pack("<d", item)
+    elif item is None:
+        tag, payload = b"n", b""
+    elif isinstance(item, tuple):
+        encoded += b"t" + len(item).to_bytes(8, "little")
+        for part in item:
+            _encodeItem(part, encoded)
+        return
+    else:
+        raise TypeError(f"CountMinBag items must be str, bytes, int, float, None or tuples of these, not {type(item).__name__}.")
+    encoded += tag + len(payload).to_bytes(8, "little") + payload
+
+
+if __name__ == '__main__':
+    # Example 1: Basic usage
+    bag = CountMinBag(error=0.01, confidence=0.99)
+    bag.add("apple")
+    bag.add("banana")
+    bag.add("apple", 2)
+    print("Example 1: Basic usage")
+    print("Bag:", bag)
+    print("Number of 'apple's:", bag.num_of("apple"))
+    print("Number of 'banana's:", bag.num_of("banana"))
+    print("Number of 'orange's:", bag.num_of("orange"))
+    print()
+
+    # Example 2: Many distinct items in a fixed amount of memory
+    bag = CountMinBag(error=0.0001, confidence=0.999)
+    bag.update(i % 50000 for i in range(500000))
+    print("Example 2: 500000 events over 50000 distinct items")
+    print("Counter memory:", bag.memory_size(), "bytes")
+    print("Estimated count of item 7 (exact count is 10):", bag.num_of(7))
+    print()
+
+    # Example 3: Merging the counts of two shards
+    shard1 = CountMinBag(error=0.01)
+    shard2 = CountMinBag(error=0.01)
+    shard1.update(["apple", "banana", "apple"])
+    shard2.update(["apple", "cherry"])
+    shard1.merge(shard2)
+    print("Example 3: Merging shards")
+    print("Number of 'apple's after merging:", shard1.num_of("apple"))
+    print("Bag size after merging:", shard1.size())
+    print()
@@ -3,7 +3,14 @@
 operation, which returns the number of occurrences of the given item in the
 bag. Implement the Counting Bag ADT and defend your selection of data
 structure.
+
+The counts are kept in a dictionary, so adding, removing and counting an item
+take O(1) time. The total number of items is kept up to date as items are
+added and removed, so size() is O(1) as well.
 """
+import heapq
+from collections import Counter
+from operator import itemgetter
 
 class CountingBag:
     """
@@ -11,6 +18,8 @@ class CountingBag:
 
     This method initializes an instance of the CountingBag class with an empty dictionary.
     The dictionary, named 'items', will store the items in the bag as keys and their counts as values.
+    The total number of items is kept in '_total'; change the counts through the methods
+    of the bag, not through 'items' directly, so that the total stays correct.
 
     Parameters:
     None
@@ -20,25 +29,56 @@ class CountingBag:
     """
     def __init__(self):
         self.items = {}
+        self._total = 0
+
+    def add(self, item, n=1):
+        """Add n occurrences of item to the bag."""
+        assert n >= 0, "The number of occurrences must be >= 0."
+        if n == 0:
+            return
+        self.items[item] = self.items.get(item, 0) + n
+        self._total += n
 
-    def add(self, item):
-        if item in self.items:
-            self.items[item] += 1
+    def remove(self, item, n=1):
+        """Remove up to n occurrences of item from the bag."""
+        assert n >= 0, "The number of occurrences must be >= 0."
+        count = self.items.get(item, 0)
+        if count == 0:
+            return
+        if count > n:
+            self.items[item] = count - n
+            self._total -= n
         else:
-            self.items[item] = 1
+            del self.items[item]
+            self._total -= count
+
+    def update(self, iterable):
+        """Add one occurrence of every item in iterable to the bag."""
+        # Counter counts the batch in C; then each distinct item is merged once.
+        self._addCounts(Counter(iterable))
+
+    def merge(self, other):
+        """Add all the occurrences in another CountingBag to this bag."""
+        self._addCounts(other.items)
+
+    def most_common(self, k):
+        """Return the k items with the largest counts as (item, count) pairs, largest first."""
+        return heapq.nlargest(k, self.items.items(), key=itemgetter(1))
 
-    def remove(self, item):
-        if item in self.items:
-            if self.items[item] > 1:
-                self.items[item] -= 1
-            else:
-                del self.items[item]
+    def _addCounts(self, counts):
+        items = self.items
+        total = 0
+        for item, count in counts.items():
+            if count > 0:
+                items[item] = items.get(item, 0) + count
+                total += count
+        self._total += total
 
     def is_empty(self):
         return len(self.items) == 0
 
     def size(self):
-        return sum(self.items.values())
+        return self._total
 
     def num_of(self, item):
         return self.items.get(item, 0)
@@ -98,4 +138,19 @@ if __name__ == '__main__':
     print("Bag contents:", bag)
     print("Number of 'apple's:", bag.num_of("apple"))
     print("Number of 'banana's:", bag.num_of("banana"))
+    print()
+
+    # Example 5: Bulk counting, merging and the most common items
+    bag = CountingBag()
+    bag.update(["apple", "banana", "apple", "cherry", "apple"])
+    bag.add("cherry", 3)
+    other = CountingBag()
+    other.update(["banana", "banana", "durian"])
+    bag.merge(other)
+    print("Example 5: Bulk counting and merging")
+    print("Bag contents:", bag)
+    print("Bag size:", bag.size())
+    print("Two most common items:", bag.most_common(2))
+    bag.remove("cherry", 10)
+    print("After removing up to 10 'cherry's:", bag, "size:", bag.size())
     print()
\ No newline at end of file
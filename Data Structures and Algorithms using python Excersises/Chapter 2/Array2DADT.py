@@ -1,18 +1,52 @@
 from ArrayADT import Array
 
-# Implementation of the Array2D ADT using an array of arrays.
+# Implementation of the Array2D ADT using a single 1-D array in row-major order.
 class Array2D:
     """
     Represents a two-dimensional array with operations such as initialization,
     getting and setting values, clearing the array, and accessing dimensions.
+
+    All cells live in one contiguous Array; element [i, j] is stored at
+    position i * numCols + j.
+
+    Attributes:
+        _numRows (int): The number of rows.
+        _numCols (int): The number of columns.
+        _theElements (Array): The cells of the array in row-major order.
     """
-    def __init__(self, numRows, numCols):
-        # Create a 1-D array to store an array reference for each row.
-        self._theRows = Array( numRows )
+    def __init__(self, numRows, numCols, dtype = None):
+        assert numRows > 0 and numCols > 0, "Array dimensions must be > 0"
+        self._numRows = numRows
+        self._numCols = numCols
+
+        # Create one 1-D array large enough to hold every cell.
+        self._theElements = Array(numRows * numCols, dtype)
 
-        # Create the 1-D arrays for each row of the 2-D array.
-        for i in range(numRows):
-            self._theRows[i] = Array(numCols)
+    # Creates a 2-D array on top of an existing buffer without copying it.
+    @classmethod
+    def fromBuffer(cls, buffer, numRows, numCols, dtype):
+        """
+        Creates a typed 2-D array that shares the memory of an existing buffer.
+
+        Args:
+            buffer: A writable, C-contiguous buffer holding the cells in row-major order.
+            numRows (int): The number of rows.
+            numCols (int): The number of columns.
+            dtype (str): The typecode of the cells.
+
+        Returns:
+            Array2D: A 2-D array backed by the buffer.
+
+        Raises:
+            AssertionError: If the buffer does not hold exactly numRows * numCols cells.
+        """
+        theElements = Array.fromBuffer(buffer, dtype)
+        assert len(theElements) == numRows * numCols, "Buffer size does not match the array dimensions."
+        theGrid = cls.__new__(cls)
+        theGrid._numRows = numRows
+        theGrid._numCols = numCols
+        theGrid._theElements = theElements
+        return theGrid
 
     # Returns the number of rows in the 2-D array.
     def numRows(self):
@@ -22,7 +56,7 @@ class Array2D:
         Returns:
             int: Number of rows in the 2-D array.
         """
-        return len(self._theRows)
+        return self._numRows
 
     # Returns the number of columns in the 2-D array.
     def numCols(self):
@@ -32,7 +66,27 @@ class Array2D:
         Returns:
             int: Number of columns in the 2-D array.
         """
-        return len(self._theRows[0])
+        return self._numCols
+
+    # Returns the typecode of the underlying storage.
+    def dtype(self):
+        """
+        Returns the typecode of the cells.
+
+        Returns:
+            str or None: The typecode, or None if the cells store Python objects.
+        """
+        return self._theElements.dtype()
+
+    # Returns a flat memoryview of the cells of a typed 2-D array.
+    def buffer(self):
+        """
+        Returns a memoryview over the cells in row-major order without copying.
+
+        Returns:
+            memoryview: A writable view of the storage.
+        """
+        return self._theElements.buffer()
 
     # Clears the array by setting every element to the given value.
     def clear(self, value = None):
@@ -42,8 +96,7 @@ class Array2D:
         Args:
             value: Value to set each element to.
         """
-        for row in self._theRows:
-            row.clear(value)
+        self._theElements.clear(value)
 
     # Gets the contents of the element at position [i, j]
     def __getitem__(self, ndxTuple):
@@ -60,11 +113,9 @@ class Array2D:
             AssertionError: If the indices are out of range.
         """
         assert len(ndxTuple) == 2, "Invalid number of array subscripts."
-        row = ndxTuple[0]
-        col = ndxTuple[1]
-        assert row >= 0 and row < self.numRows() and col >= 0 and col < self.numCols(), "Array subscript out of range."
-        the1dArray = self._theRows[row]
-        return the1dArray[col]
+        row, col = ndxTuple
+        assert 0 <= row < self._numRows and 0 <= col < self._numCols, "Array subscript out of range."
+        return self._theElements[row * self._numCols + col]
 
     # Sets the contents of the element at position [i,j] to value.
     def __setitem__(self, ndxTuple, value):
@@ -79,11 +130,86 @@ class Array2D:
             AssertionError: If the indices are out of range.
         """
         assert len(ndxTuple) == 2, "Invalid number of array subscripts."
-        row = ndxTuple[0]
-        col = ndxTuple[1]
-        assert row >= 0 and row < self.numRows() and col >= 0 and col < self.numCols(), "Array subscript out of range."
-        the1dArray = self._theRows[row]
-        the1dArray[col] = value
+        row, col = ndxTuple
+        assert 0 <= row < self._numRows and 0 <= col < self._numCols, "Array subscript out of range."
+        self._theElements[row * self._numCols + col] = value
+
+    # Returns a view of the given row that shares storage with the 2-D array.
+    def row(self, row):
+        """
+        Returns a view of a row without copying it.
+
+        Args:
+            row (int): The index of the row.
+
+        Returns:
+            _Array2DView: A view whose elements are the cells of the row.
+
+        Raises:
+            AssertionError: If the row index is out of range.
+        """
+        assert 0 <= row < self._numRows, "Array subscript out of range."
+        return _Array2DView(self._theElements, row * self._numCols, 1, self._numCols)
+
+    # Returns a view of the given column that shares storage with the 2-D array.
+    def col(self, col):
+        """
+        Returns a view of a column without copying it.
+
+        Args:
+            col (int): The index of the column.
+
+        Returns:
+            _Array2DView: A view whose elements are the cells of the column.
+
+        Raises:
+            AssertionError: If the column index is out of range.
+        """
+        assert 0 <= col < self._numCols, "Array subscript out of range."
+        return _Array2DView(self._theElements, col, self._numCols, self._numRows)
+
+
+# A strided window onto the flat storage used for row and column views.
+class _Array2DView:
+    """
+    A 1-D view of every stride-th element of an Array, starting at start.
+    Reads and writes go straight to the underlying storage.
+    """
+    def __init__(self, theArray, start, stride, length):
+        self._theArray = theArray
+        self._start = start
+        self._stride = stride
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._theArray[self._baseSlice(index)]
+        assert 0 <= index < self._length, "View subscript out of range."
+        return self._theArray[self._start + index * self._stride]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._theArray[self._baseSlice(index)] = value
+            return
+        assert 0 <= index < self._length, "View subscript out of range."
+        self._theArray[self._start + index * self._stride] = value
+
+    def __iter__(self):
+        return iter(self[:])
+
+    # Maps a slice of the view onto the equivalent slice of the storage.
+    def _baseSlice(self, index):
+        ndx = range(self._length)[index]
+        if not ndx:
+            return slice(0, 0)
+        start = self._start + ndx.start * self._stride
+        stop = self._start + ndx.stop * self._stride
+        if stop < 0:
+            stop = None
+        return slice(start, stop, ndx.step * self._stride)
 
 if __name__ == "__main__":
     # Example usage of Array2D
@@ -103,6 +229,12 @@ if __name__ == "__main__":
         for j in range(my2DArray.numCols()):
             print(f"Element at [{i}, {j}]: {my2DArray[i,j]}")
 
+    # Rows and columns can be read and written through views.
+    print("\nRow 0 view:", my2DArray.row(0)[:])
+    print("Column 3 view:", my2DArray.col(3)[:])
+    my2DArray.col(1)[:] = [7, 8, 9]
+    print("After my2DArray.col(1)[:] = [7, 8, 9], row 1 is:", list(my2DArray.row(1)))
+
     # Clearing the array
     print("\nClearing the array with value 0: my2DArray.clear(0)")
     my2DArray.clear(0)
@@ -1,35 +1,91 @@
 # Implements the Array ADT using array capabilities of the ctypes module.
 import ctypes
 
+# Maps the supported typecodes (the same ones used by the standard array module)
+# to the ctypes element type used for typed, buffer-backed arrays.
+_TYPECODES = {
+    'b': ctypes.c_byte,
+    'B': ctypes.c_ubyte,
+    'h': ctypes.c_short,
+    'H': ctypes.c_ushort,
+    'i': ctypes.c_int,
+    'I': ctypes.c_uint,
+    'l': ctypes.c_long,
+    'L': ctypes.c_ulong,
+    'q': ctypes.c_longlong,
+    'Q': ctypes.c_ulonglong,
+    'f': ctypes.c_float,
+    'd': ctypes.c_double,
+}
+
 class Array:
     """
     Represents an array data type with operations such as initialization,
     getting and setting values, clearing the array, and iteration over elements.
+
+    By default every element is a reference to a Python object. When a typecode
+    is given the elements are stored as primitive values in one contiguous
+    buffer, which uses far less memory and can be shared through a memoryview.
     
     Attributes:
         _size (int): The size of the array.
-        _elements (ctypes.py_object * size): A ctypes array object holding the actual elements.
+        _dtype (str or None): The typecode of the elements, or None for object references.
+        _elements (ctypes.Array): A ctypes array object holding the actual elements.
     """
 
-    def __init__(self, size):
+    def __init__(self, size, dtype = None):
         """
         Constructs all the necessary attributes for the Array object.
 
         Args:
             size (int): The number of elements the array will hold.
+            dtype (str, optional): Typecode of a primitive element type such as
+                'i', 'l' or 'd'. Defaults to None, which stores Python objects.
 
         Raises:
-            AssertionError: If size <= 0.
+            AssertionError: If size <= 0 or the typecode is not supported.
         """
         assert size > 0, "Array size must be > 0"
+        assert dtype is None or dtype in _TYPECODES, "Unsupported array typecode"
         self._size = size
+        self._dtype = dtype
+
+        if dtype is None:
+            # Create the array structure using the ctypes module.
+            PyArrayType = ctypes.py_object * size
+            self._elements = PyArrayType()
+
+            # Initialize each element.
+            self.clear(None)
+        else:
+            # Primitive ctypes arrays are zero-filled when they are allocated.
+            self._elements = (_TYPECODES[dtype] * size)()
+
+    @classmethod
+    def fromBuffer(cls, buffer, dtype):
+        """
+        Creates a typed Array that shares the memory of an existing buffer.
+
+        Args:
+            buffer: A writable, C-contiguous object supporting the buffer protocol.
+            dtype (str): The typecode of the elements stored in the buffer.
 
-        # Create the array structure using the ctypes module.
-        PyArrayType = ctypes.py_object * size
-        self._elements = PyArrayType()
+        Returns:
+            Array: An array whose elements are the buffer's contents, without copying.
 
-        # Initialize each element.
-        self.clear(None)
+        Raises:
+            AssertionError: If the typecode is not supported or the buffer is empty
+                or not a whole number of elements.
+        """
+        assert dtype in _TYPECODES, "Unsupported array typecode"
+        itemsize = ctypes.sizeof(_TYPECODES[dtype])
+        nbytes = memoryview(buffer).nbytes
+        assert nbytes > 0 and nbytes % itemsize == 0, "Buffer does not hold a whole number of elements"
+        theArray = cls.__new__(cls)
+        theArray._size = nbytes // itemsize
+        theArray._dtype = dtype
+        theArray._elements = (_TYPECODES[dtype] * theArray._size).from_buffer(buffer)
+        return theArray
 
     def __len__(self):
         """
@@ -42,43 +98,132 @@ class Array:
 
     def __getitem__(self, index):
         """
-        Gets the contents of the index element.
+        Gets the contents of the index element, or of every element in a slice.
 
         Args:
-            index (int): The index of the element to get.
+            index (int or slice): The index of the element to get.
 
         Returns:
-            The element at the specified index.
+            The element at the specified index, or a list of the sliced elements.
 
         Raises:
             AssertionError: If index is out of range.
         """
-        assert index >= 0 and index < len(self), "Array subscript out of range"
+        if isinstance(index, slice):
+            return self._elements[ index ]
+        assert 0 <= index < self._size, "Array subscript out of range"
         return self._elements[ index ]
 
     def __setitem__(self, index, value):
         """
-        Puts the value in the array element at index position.
+        Puts the value in the array element at index position. When index is a
+        slice, value must be a sequence of the same length as the slice.
 
         Args:
-            index (int): The index where the value should be placed.
+            index (int or slice): The index where the value should be placed.
             value: The value to place in the array.
 
         Raises:
             AssertionError: If index is out of range.
+            ValueError: If a sliced assignment changes the size of the array.
         """
-        assert index >= 0 and index < len(self), "Array subscript out of range"
+        if isinstance(index, slice):
+            if isinstance(value, Array):
+                value = value._elements
+            self._elements[ index ] = value
+            return
+        assert 0 <= index < self._size, "Array subscript out of range"
         self._elements[ index ] = value
 
     def clear(self, value = None):
         """
         Clears the array by setting each element to the given value.
 
+        Typed arrays are cleared to zero when no value is given.
+
         Args:
             value: The value to set each element to.
         """
-        for i in range( len(self) ) :
-            self._elements[i] = value
+        self.fill(value)
+
+    def fill(self, value, start = 0, stop = None):
+        """
+        Sets every element in the range [start, stop) to the given value.
+
+        Args:
+            value: The value to set each element to.
+            start (int, optional): The first index to fill. Defaults to 0.
+            stop (int, optional): One past the last index to fill. Defaults to the size of the array.
+
+        Raises:
+            AssertionError: If the range is out of bounds.
+        """
+        if stop is None:
+            stop = self._size
+        assert 0 <= start <= stop <= self._size, "Array range out of bounds"
+        if self._dtype is not None and not value:
+            itemsize = ctypes.sizeof(self._elements._type_)
+            ctypes.memset(ctypes.addressof(self._elements) + start * itemsize, 0, (stop - start) * itemsize)
+        else:
+            self._elements[start:stop] = [value] * (stop - start)
+
+    def copy_from(self, src, src_start = 0, dst_start = 0, n = None):
+        """
+        Copies n elements of src, starting at src_start, into this array starting
+        at dst_start. The source may be another Array (including this one, with
+        overlapping ranges) or any sliceable sequence.
+
+        Args:
+            src (Array or sequence): The elements to copy.
+            src_start (int, optional): The first index to read from src. Defaults to 0.
+            dst_start (int, optional): The first index to write in this array. Defaults to 0.
+            n (int, optional): The number of elements to copy. Defaults to as many as fit.
+
+        Raises:
+            AssertionError: If either range is out of bounds.
+        """
+        if n is None:
+            n = min(len(src) - src_start, self._size - dst_start)
+        assert n >= 0 and 0 <= src_start and src_start + n <= len(src), "Source range out of bounds"
+        assert 0 <= dst_start and dst_start + n <= self._size, "Destination range out of bounds"
+        if isinstance(src, Array):
+            if self._dtype is not None and src._dtype == self._dtype:
+                # Same primitive layout on both sides: move the raw bytes.
+                itemsize = ctypes.sizeof(self._elements._type_)
+                ctypes.memmove(ctypes.addressof(self._elements) + dst_start * itemsize,
+                               ctypes.addressof(src._elements) + src_start * itemsize,
+                               n * itemsize)
+                return
+            src = src._elements
+        self._elements[dst_start:dst_start + n] = src[src_start:src_start + n]
+
+    def dtype(self):
+        """
+        Returns the typecode of the elements.
+
+        Returns:
+            str or None: The typecode, or None if the array stores Python objects.
+        """
+        return self._dtype
+
+    def buffer(self):
+        """
+        Returns a memoryview over the storage of a typed array without copying.
+
+        Returns:
+            memoryview: A writable view of the contiguous element buffer.
+
+        Raises:
+            AssertionError: If the array stores Python objects.
+        """
+        assert self._dtype is not None, "Only typed arrays expose a buffer"
+        return memoryview(self._elements).cast('B').cast(self._dtype)
+
+    def __buffer__(self, flags):
+        """
+        Supports the buffer protocol for typed arrays (Python 3.12+).
+        """
+        return self.buffer()
 
     def __iter__(self):
         """
@@ -149,3 +294,15 @@ if __name__ == "__main__":
     print("\nAfter clearing the array:")
     for i, val in enumerate(a):
         print(f"{i}: {val}")
+
+    # A typed array keeps its elements in one contiguous primitive buffer.
+    d = Array(5, 'd')
+    d.clear(1.5)
+    d[2] = 4.0
+    print("\nTyped array with dtype 'd':", list(d))
+    print("Buffer view:", d.buffer().tolist())
+
+    # Ranges can be read, written, filled and copied in one operation.
+    d.fill(0.0, 3)
+    d.copy_from(d, 0, 1, 2)
+    print("After fill(0.0, 3) and copy_from(d, 0, 1, 2):", d[:])
@@ -24,49 +24,155 @@
 #  multiply ( rhsMatrix ): Creates and returns a new matrix that is the result of multiplying this matrix to the given rhsMatrix. The two matrices must be
 # of appropriate sizes as defined for matrix multiplication.
 
+import array
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from Array2DADT import Array2D
 
+# NumPy is optional. When it is installed, matrices with a typed (numeric)
+# storage delegate their arithmetic to vectorized ndarray operations.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Products with a dimension of at least this size use the blocked kernel.
+_BLOCKED_THRESHOLD = 256
+
+# Edge length of the square tiles used by the blocked kernel.
+_BLOCK_SIZE = 64
+
+# Number of elements evaluated at a time by a fused expression using NumPy.
+_FUSED_BAND_SIZE = 4096
+
+# Typecodes of typed matrices that hold integers.
+_INTEGER_TYPECODES = tuple("bBhHiIlLqQ")
+
 class Matrix:
     """
     Implements a matrix with basic operations such as addition, subtraction,
     multiplication, scaling, and transposition.
 
+    A matrix created with a typecode (e.g. Matrix(n, m, 'd')) keeps its
+    elements in a primitive buffer. If NumPy is available such matrices can
+    be exchanged with ndarrays without copying, and add, subtract, multiply,
+    scaleBy, transpose and scalar multiplication run as vectorized NumPy
+    operations. Otherwise the pure-Python implementation is used. Both give
+    the same values: NumPy computes new integer results in 64 bits, and
+    products or sums that might not fit in 64 bits use the pure-Python code.
+
+    transposeView() returns a matrix that shares the grid of this one with
+    the row and column indices swapped, so no elements are copied.
+
     Attributes:
         _theGrid (Array2D): Stores the matrix elements.
+        _transposed (bool): True if this matrix is a transposed view of _theGrid.
     """
-    def __init__(self, numRows, numCols):
+    def __init__(self, numRows, numCols, dtype = None):
         """Initializes a matrix with the given number of rows and columns from instance of Array2D."""
-        self._theGrid = Array2D(numRows, numCols)
+        self._theGrid = Array2D(numRows, numCols, dtype)
         self._theGrid.clear(0)
+        self._transposed = False
+
+    @classmethod
+    def fromNumpy(cls, ndarray):
+        """
+        Creates a matrix that shares the memory of a 2-D ndarray.
+
+        The data is only copied if the ndarray is not C-contiguous, writable
+        and in the native byte order.
+        """
+        assert numpy is not None, "NumPy is not available."
+        assert ndarray.ndim == 2, "Only 2-D arrays can be converted to a matrix."
+        if not ndarray.dtype.isnative:
+            ndarray = ndarray.astype(ndarray.dtype.newbyteorder('='), order='C')
+        elif not (ndarray.flags.c_contiguous and ndarray.flags.writeable):
+            ndarray = numpy.array(ndarray, order='C')
+        newMatrix = cls.__new__(cls)
+        newMatrix._theGrid = Array2D.fromBuffer(ndarray, ndarray.shape[0], ndarray.shape[1], ndarray.dtype.char)
+        newMatrix._transposed = False
+        return newMatrix
+
+    def toNumpy(self):
+        """
+        Returns a 2-D ndarray that shares the memory of this matrix.
+        The matrix must have been created with a typecode.
+        """
+        assert numpy is not None, "NumPy is not available."
+        assert self.dtype() is not None, "Only typed matrices can be viewed as an ndarray."
+        view = numpy.asarray(self._theGrid.buffer()).reshape(self._theGrid.numRows(), self._theGrid.numCols())
+        return view.T if self._transposed else view
+
+    def dtype(self):
+        """Returns the typecode of the matrix elements, or None for Python objects."""
+        return self._theGrid.dtype()
 
     def numRows(self):
         """Returns the number of rows in the matrix."""
+        if self._transposed:
+            return self._theGrid.numCols()
         return self._theGrid.numRows()
     
     def numCols(self):
         """Returns the number of columns in the matrix."""
+        if self._transposed:
+            return self._theGrid.numRows()
         return self._theGrid.numCols()
     
     def __getitem__(self, ndxTuple):
+        if self._transposed:
+            return self._theGrid[ndxTuple[1], ndxTuple[0]]
         return self._theGrid[ndxTuple[0], ndxTuple[1]]
     
     def __setitem__(self, ndxTuple, scalar):
-        self._theGrid[ndxTuple[0], ndxTuple[1]] = scalar
+        if self._transposed:
+            self._theGrid[ndxTuple[1], ndxTuple[0]] = scalar
+        else:
+            self._theGrid[ndxTuple[0], ndxTuple[1]] = scalar
 
     def __add__(self, rhsMatrix):
+        if isinstance(rhsMatrix, _MatrixExpression):
+            return NotImplemented
         return self.add(rhsMatrix)
     
     def __sub__(self, rhsMatrix):
+        if isinstance(rhsMatrix, _MatrixExpression):
+            return NotImplemented
         return self.subtract(rhsMatrix)
 
     def __mul__(self, rhsMatrix):
+        if isinstance(rhsMatrix, _MatrixExpression):
+            # Lazy expressions only support scalar multiplication.
+            return NotImplemented
         return self.multiply(rhsMatrix)
     
+    def __iadd__(self, rhsMatrix):
+        return self.add(rhsMatrix, out=self)
+
+    def __isub__(self, rhsMatrix):
+        return self.subtract(rhsMatrix, out=self)
+
+    def __imul__(self, scalar):
+        if isinstance(scalar, Matrix):
+            # A matrix product cannot be computed in place; fall back to __mul__.
+            return NotImplemented
+        self.scaleBy(scalar)
+        return self
+
     def __rmul__(self, scalar):
+        if isinstance(scalar, (Matrix, _MatrixExpression)):
+            return NotImplemented
+        if self._usesNumpy():
+            view = self.toNumpy()
+            if view.dtype.kind not in "iu" or not isinstance(scalar, (int, numpy.integer)):
+                return _matrixFromNumpy(view * scalar)
+            dtype = _exactIntegerType(lambda: _maxAbs(view) * abs(int(scalar)))
+            if dtype is not None:
+                return _matrixFromNumpy(numpy.multiply(view, scalar, dtype=dtype))
         newMatrix = Matrix(self.numRows(), self.numCols())
         for r in range(self.numRows()):
-            for c in range(self.numCols()):
-                newMatrix[r, c] = self[r, c] * scalar
+            newMatrix._setRow(r, [value * scalar for value in self._rowList(r)])
         return newMatrix
     
     def __str__(self):
@@ -101,61 +207,448 @@ class Matrix:
     def scaleBy(self, scalar):
         """
         Scales all elements of the matrix by the given scalar.
+
+        The matrix keeps its typecode, so an integer matrix can only be
+        scaled by an integral scalar; use scalar * matrix to get a new
+        matrix of a wider type instead.
         """
+        if self.dtype() in _INTEGER_TYPECODES:
+            assert float(scalar).is_integer(), \
+                   "An integer matrix can only be scaled in place by an integral scalar."
+            scalar = int(scalar)
+        if self._usesNumpy():
+            view = self.toNumpy()
+            view *= scalar
+            return
         for r in range(self.numRows()):
-            for c in range(self.numCols()):
-                self[r, c] *= scalar
+            self._setRow(r, [value * scalar for value in self._rowList(r)])
 
     def transpose(self):
         """
         Returns a new matrix that is the transpose of this matrix.
         """
+        if self._usesNumpy():
+            return _matrixFromNumpy(numpy.ascontiguousarray(self.toNumpy().T))
         newMatrix = Matrix(self.numCols(), self.numRows())
         for r in range(self.numRows()):
-            for c in range(self.numCols()):
-                newMatrix[c, r] = self[r, c]
+            newMatrix._theGrid.col(r)[:] = self._rowList(r)
         return newMatrix
-    
-    def add(self, rhsMatrix):
+
+    def lazy(self):
         """
-        Adds the current matrix to another matrix of the same size.
-        Returns a new matrix.
+        Returns a deferred expression for this matrix. Combining it with +, -
+        and scalar * builds an expression tree instead of a matrix for each
+        operator; evaluate() then computes the result in a single pass.
         """
-        assert rhsMatrix.numRows() == self.numRows() and rhsMatrix.numCols() == self.numCols(), \
-               "Matrices must be of the same size."
-        newMatrix = Matrix(self.numRows(), self.numCols())
-        for r in range(self.numRows()):
-            for c in range(self.numCols()):
-                newMatrix[r, c] = self[r, c] + rhsMatrix[r, c]
+        return _MatrixExpression('leaf', (self,), self.numRows(), self.numCols())
 
+    def transposeView(self):
+        """
+        Returns the transpose of this matrix as a view that shares its
+        elements. Changes made through either matrix are seen by both.
+        """
+        newMatrix = Matrix.__new__(Matrix)
+        newMatrix._theGrid = self._theGrid
+        newMatrix._transposed = not self._transposed
         return newMatrix
+
+    def isTransposedView(self):
+        """Determines if this matrix reads its grid in transposed order."""
+        return self._transposed
+    
+    def add(self, rhsMatrix, out = None):
+        """
+        Adds the current matrix to another matrix of the same size.
+        Returns a new matrix, or stores the sum in out and returns out.
+        """
+        return self._elementwise(rhsMatrix, operator.add, out)
     
-    def subtract(self, rhsMatrix):
+    def subtract(self, rhsMatrix, out = None):
         """
         Subtracts another matrix of the same size from the current matrix.
-        Returns a new matrix.
+        Returns a new matrix, or stores the difference in out and returns out.
         """
-        assert rhsMatrix.numRows() == self.numRows() and rhsMatrix.numCols() == self.numCols(), \
-               "Matrices must be of the same size."
-        newMatrix = Matrix(self.numRows(), self.numCols())
-        for r in range(self.numRows()):
-            for c in range(self.numCols()):
-                newMatrix[r, c] = self[r, c] - rhsMatrix[r, c]
-
-        return newMatrix
+        return self._elementwise(rhsMatrix, operator.sub, out)
     
-    def multiply(self, rhsMatrix):
+    def multiply(self, rhsMatrix, out = None, workers = None):
         """
         Multiplies the current matrix with another matrix.
-        Returns a new matrix.
+        Returns a new matrix, or stores the product in out and returns out.
+        The out matrix must not share its elements with either operand.
+
+        The product is computed a whole row at a time in i-k-j order, reading
+        both operands straight from their row storage. Large products are
+        split into tiles so the working set stays small.
+
+        If workers is greater than 1 and both operands are typed matrices, the
+        output rows are split across a pool of that many processes. The
+        operands are placed in shared memory once instead of being pickled
+        for each worker. NumPy, when used, is already multi-threaded, so
+        workers only applies to the pure-Python kernel. Like the serial
+        kernel, it returns an untyped matrix of exact values; if a product
+        does not fit in 64 bits it falls back to the serial kernel.
         """
         assert self.numCols() == rhsMatrix.numRows(), "Matrix dimensions incompatible for multiplication."
-        newMatrix = Matrix(self.numRows(), rhsMatrix.numCols())
-        for r in range(self.numRows()):
-            for c in range(rhsMatrix.numCols()):
-                for i in range(self.numCols()):
-                    newMatrix[r, c] += self[r, i] * rhsMatrix[i, c]
-        return newMatrix
+        if out is not None:
+            assert out.numRows() == self.numRows() and out.numCols() == rhsMatrix.numCols(), \
+                   "Output matrix has the wrong size."
+            assert not out._sharesGrid(self, rhsMatrix), "Output matrix must not share storage with an operand."
+        if self._usesNumpy(rhsMatrix):
+            if out is None:
+                lhs, rhs = self.toNumpy(), rhsMatrix.toNumpy()
+                if numpy.result_type(lhs, rhs).kind not in "iu":
+                    return _matrixFromNumpy(lhs @ rhs)
+                dtype = _exactIntegerType(lambda: self.numCols() * _maxAbs(lhs) * _maxAbs(rhs))
+                if dtype is not None:
+                    return _matrixFromNumpy(numpy.matmul(lhs, rhs, dtype=dtype))
+            elif out._usesNumpy():
+                numpy.matmul(self.toNumpy(), rhsMatrix.toNumpy(), out=out.toNumpy())
+                return out
+        if workers is not None and workers > 1 and self.dtype() is not None and rhsMatrix.dtype() is not None:
+            result = self._multiplyParallel(rhsMatrix, out, workers)
+            if result is not None:
+                return result
+        if out is None:
+            out = Matrix(self.numRows(), rhsMatrix.numCols())
+        lhsRows = [self._rowList(r) for r in range(self.numRows())]
+        if rhsMatrix._transposed:
+            # The columns of a transposed view are contiguous rows of its grid,
+            # so each output element is a dot product of two stored rows.
+            rhsCols = [rhsMatrix._theGrid.row(c)[:] for c in range(rhsMatrix.numCols())]
+            for r, lhsRow in enumerate(lhsRows):
+                out._setRow(r, [sum(map(operator.mul, lhsRow, rhsCol), 0) for rhsCol in rhsCols])
+            return out
+        rhsRows = [rhsMatrix._rowList(r) for r in range(rhsMatrix.numRows())]
+        if max(self.numRows(), self.numCols(), rhsMatrix.numCols()) >= _BLOCKED_THRESHOLD:
+            result = _multiplyBlocked(lhsRows, rhsRows, rhsMatrix.numCols())
+        else:
+            result = _multiplyRows(lhsRows, rhsRows, rhsMatrix.numCols())
+        for r, values in enumerate(result):
+            out._setRow(r, values)
+        return out
+
+    def _multiplyParallel(self, rhsMatrix, out, workers):
+        """
+        Computes the product in a process pool, sharing the operands and result
+        through shared memory. Returns None if an integer product overflows
+        the 64-bit shared result.
+        """
+        numRows, inner, numCols = self.numRows(), self.numCols(), rhsMatrix.numCols()
+        # Accumulate in the widest type so the values match the serial kernel.
+        if self.dtype() in _INTEGER_TYPECODES and rhsMatrix.dtype() in _INTEGER_TYPECODES:
+            outDtype = 'q'
+        else:
+            outDtype = 'd'
+        blocks = []
+        try:
+            lhsBlock = _sharedCopy(self, blocks)
+            rhsBlock = _sharedCopy(rhsMatrix, blocks)
+            resultBlock = _sharedCopy(Matrix(numRows, numCols, outDtype), blocks)
+
+            # Hand out several row ranges per worker so uneven rows balance out.
+            chunk = max(1, -(-numRows // (workers * 4)))
+            tasks = [(lhsBlock, rhsBlock, resultBlock, self.dtype(), rhsMatrix.dtype(), outDtype,
+                      numRows, inner, numCols, start, min(start + chunk, numRows))
+                     for start in range(0, numRows, chunk)]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(_multiplyWorker, tasks))
+            except OverflowError:
+                return None
+
+            result = Matrix(numRows, numCols) if out is None else out
+            nbytes = numRows * numCols * array.array(outDtype).itemsize
+            with blocks[2].buf[:nbytes] as raw, raw.cast(outDtype) as resultView:
+                for r in range(numRows):
+                    result._setRow(r, resultView[r * numCols:(r + 1) * numCols].tolist())
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return result
+
+    def _elementwise(self, rhsMatrix, op, out):
+        """Applies a binary operator to each pair of elements, storing the result in out or a new matrix."""
+        assert rhsMatrix.numRows() == self.numRows() and rhsMatrix.numCols() == self.numCols(), \
+               "Matrices must be of the same size."
+        if out is not None:
+            assert out.numRows() == self.numRows() and out.numCols() == self.numCols(), \
+                   "Output matrix has the wrong size."
+        if self._usesNumpy(rhsMatrix):
+            ufunc = _NUMPY_UFUNCS[op]
+            if out is None:
+                lhs, rhs = self.toNumpy(), rhsMatrix.toNumpy()
+                if numpy.result_type(lhs, rhs).kind not in "iu":
+                    return _matrixFromNumpy(ufunc(lhs, rhs))
+                dtype = _exactIntegerType(lambda: _maxAbs(lhs) + _maxAbs(rhs))
+                if dtype is not None:
+                    return _matrixFromNumpy(ufunc(lhs, rhs, dtype=dtype))
+            elif out._usesNumpy():
+                ufunc(self.toNumpy(), rhsMatrix.toNumpy(), out=out.toNumpy())
+                return out
+        if out is None:
+            if self._transposed and rhsMatrix._transposed:
+                # Combine the untransposed grids row by row and return the result as a view.
+                return self.transposeView()._elementwise(rhsMatrix.transposeView(), op, None).transposeView()
+            out = Matrix(self.numRows(), self.numCols())
+        rows = (list(map(op, self._rowList(r), rhsMatrix._rowList(r))) for r in range(self.numRows()))
+        if out._sharesGrid(self, rhsMatrix):
+            # Finish reading the operands before any of their elements are overwritten.
+            rows = list(rows)
+        for r, values in enumerate(rows):
+            out._setRow(r, values)
+        return out
+
+    def _sharesGrid(self, *others):
+        """Determines if this matrix stores its elements in the same grid as any of the others."""
+        return any(self._theGrid is matrix._theGrid for matrix in others)
+
+    def _usesNumpy(self, *others):
+        """Determines if this matrix and the given operands can use the NumPy backend."""
+        if numpy is None:
+            return False
+        return all(matrix.dtype() is not None for matrix in (self,) + others)
+
+    def _rowList(self, row):
+        """Returns the values of the given row as a list."""
+        if self._transposed:
+            return self._theGrid.col(row)[:]
+        return self._theGrid.row(row)[:]
+
+    def _setRow(self, row, values):
+        """Overwrites the given row with a sequence of values."""
+        if self._transposed:
+            self._theGrid.col(row)[:] = values
+        else:
+            self._theGrid.row(row)[:] = values
+
+
+# A deferred elementwise expression over matrices of the same size.
+class _MatrixExpression:
+    """
+    An expression tree of matrices combined with +, - and scalar *, created
+    through Matrix.lazy(). Nothing is computed until evaluate() is called,
+    which compiles the whole tree into one kernel and applies it row by row,
+    so no intermediate matrix is allocated for the individual operators.
+    """
+    def __init__(self, op, operands, numRows, numCols):
+        self._op = op
+        self._operands = operands
+        self._numRows = numRows
+        self._numCols = numCols
+
+    def numRows(self):
+        """Returns the number of rows in the result."""
+        return self._numRows
+
+    def numCols(self):
+        """Returns the number of columns in the result."""
+        return self._numCols
+
+    def __add__(self, rhs):
+        return self._binary('+', self, rhs)
+
+    def __radd__(self, lhs):
+        return self._binary('+', lhs, self)
+
+    def __sub__(self, rhs):
+        return self._binary('-', self, rhs)
+
+    def __rsub__(self, lhs):
+        return self._binary('-', lhs, self)
+
+    def __mul__(self, scalar):
+        if isinstance(scalar, (Matrix, _MatrixExpression)):
+            return NotImplemented
+        return _MatrixExpression('*', (self, scalar), self._numRows, self._numCols)
+
+    def __rmul__(self, scalar):
+        return self.__mul__(scalar)
+
+    def __neg__(self):
+        return _MatrixExpression('neg', (self,), self._numRows, self._numCols)
+
+    def evaluate(self, out = None):
+        """
+        Computes the expression and returns it as a new matrix, or stores it
+        in out and returns out.
+        """
+        leaves = {}
+        scalars = {}
+        source = self._source(leaves, scalars)
+        matrices = list(leaves.values())
+        names = ["m%d" % i for i in range(len(matrices))]
+        if out is not None:
+            assert out.numRows() == self._numRows and out.numCols() == self._numCols, \
+                   "Output matrix has the wrong size."
+        aliased = out is not None and out._sharesGrid(*matrices)
+
+        if numpy is not None and all(m.dtype() is not None for m in matrices):
+            arrays = [m.toNumpy() for m in matrices]
+            if out is None:
+                dtype = numpy.result_type(*arrays, *scalars.values())
+                if dtype.char not in "bBhHiIlLqQfd":
+                    dtype = numpy.dtype('d')
+                out = Matrix(self._numRows, self._numCols, dtype.char)
+            if out._usesNumpy():
+                # Evaluate a band of rows at a time so the temporaries NumPy
+                # creates for each operator stay small and in cache.
+                code = compile(source, "<matrix expression>", "eval")
+                outView = out.toNumpy()
+                band = self._numRows if aliased else max(1, _FUSED_BAND_SIZE // self._numCols)
+                for start in range(0, self._numRows, band):
+                    namespace = dict(scalars)
+                    namespace.update(zip(names, (a[start:start + band] for a in arrays)))
+                    outView[start:start + band] = eval(code, namespace)
+                return out
+
+        if out is None:
+            out = Matrix(self._numRows, self._numCols)
+        kernel = eval("lambda %s: [%s for %s, in zip(%s)]" % (
+            ", ".join(names), source, ", ".join(names), ", ".join(names)), dict(scalars))
+        rows = (kernel(*[m._rowList(r) for m in matrices]) for r in range(self._numRows))
+        if aliased:
+            rows = list(rows)
+        for r, values in enumerate(rows):
+            out._setRow(r, values)
+        return out
+
+    @staticmethod
+    def _binary(op, lhs, rhs):
+        """Combines two matrices or expressions of the same size into a new expression."""
+        if not isinstance(lhs, (Matrix, _MatrixExpression)) or not isinstance(rhs, (Matrix, _MatrixExpression)):
+            return NotImplemented
+        if isinstance(lhs, Matrix):
+            lhs = lhs.lazy()
+        if isinstance(rhs, Matrix):
+            rhs = rhs.lazy()
+        assert lhs.numRows() == rhs.numRows() and lhs.numCols() == rhs.numCols(), \
+               "Matrices must be of the same size."
+        return _MatrixExpression(op, (lhs, rhs), lhs.numRows(), lhs.numCols())
+
+    def _source(self, leaves, scalars):
+        """
+        Returns the Python source of the expression. Each distinct matrix is
+        named m<i> in leaves and each scalar s<i> in scalars.
+        """
+        if self._op == 'leaf':
+            matrix = self._operands[0]
+            if id(matrix) not in leaves:
+                leaves[id(matrix)] = matrix
+            return "m%d" % list(leaves).index(id(matrix))
+        if self._op == 'neg':
+            return "(-%s)" % self._operands[0]._source(leaves, scalars)
+        if self._op == '*':
+            name = "s%d" % len(scalars)
+            scalars[name] = self._operands[1]
+            return "(%s * %s)" % (self._operands[0]._source(leaves, scalars), name)
+        lhs = self._operands[0]._source(leaves, scalars)
+        rhs = self._operands[1]._source(leaves, scalars)
+        return "(%s %s %s)" % (lhs, self._op, rhs)
+
+# The NumPy ufunc used for each elementwise operator, when NumPy is available.
+if numpy is not None:
+    _NUMPY_UFUNCS = {operator.add: numpy.add, operator.sub: numpy.subtract}
+
+# The largest value of a 64-bit signed integer.
+_INT64_MAX = 2 ** 63 - 1
+
+# Returns the dtype in which NumPy computes an integer result: always 64-bit,
+# so that it matches the exact result of the pure-Python kernels. bound() is
+# the largest magnitude the result can have; if it does not fit in 64 bits,
+# None is returned and the caller uses the pure-Python kernel instead.
+def _exactIntegerType(bound):
+    if bound() > _INT64_MAX:
+        return None
+    return numpy.dtype(numpy.int64)
+
+# Returns the largest magnitude of the elements of an integer ndarray.
+def _maxAbs(ndarray):
+    if ndarray.size == 0:
+        return 0
+    return max(abs(int(ndarray.min())), abs(int(ndarray.max())))
+
+# Wraps the ndarray result of a vectorized operation as a Matrix, falling back
+# to object storage when NumPy produced an element type Array cannot hold.
+def _matrixFromNumpy(result):
+    if result.dtype.char in "bBhHiIlLqQfd":
+        return Matrix.fromNumpy(result)
+    newMatrix = Matrix(result.shape[0], result.shape[1])
+    for r, values in enumerate(result.tolist()):
+        newMatrix._setRow(r, values)
+    return newMatrix
+
+# Copies the elements of a typed matrix, in row-major order, into a new shared
+# memory block, which is appended to blocks. Returns the name of the block.
+# The block may be larger than requested (it is rounded up to a whole page on
+# some platforms), so only its first nbytes are used.
+def _sharedCopy(matrix, blocks):
+    nbytes = matrix.numRows() * matrix.numCols() * matrix._theGrid.buffer().itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    blocks.append(block)
+    with block.buf[:nbytes] as raw:
+        shared = Matrix.__new__(Matrix)
+        shared._theGrid = Array2D.fromBuffer(raw, matrix.numRows(), matrix.numCols(), matrix.dtype())
+        shared._transposed = False
+        if matrix._transposed:
+            for r in range(matrix.numRows()):
+                shared._setRow(r, matrix._rowList(r))
+        else:
+            shared._theGrid.buffer()[:] = matrix._theGrid.buffer()
+        del shared
+    return block.name
+
+# Runs in a pool process: computes output rows [rowStart, rowStop) from the
+# operands in shared memory and writes them into the shared result.
+def _multiplyWorker(task):
+    lhsName, rhsName, resultName, lhsDtype, rhsDtype, outDtype, numRows, inner, numCols, rowStart, rowStop = task
+    blocks = [shared_memory.SharedMemory(name=name) for name in (lhsName, rhsName, resultName)]
+    # Only the first bytes of each block hold the matrix; the rest is padding.
+    lhsBytes = numRows * inner * array.array(lhsDtype).itemsize
+    rhsBytes = inner * numCols * array.array(rhsDtype).itemsize
+    resultBytes = numRows * numCols * array.array(outDtype).itemsize
+    try:
+        # The views are released by the with statement even if the product
+        # fails, so the blocks can always be closed.
+        with blocks[0].buf[:lhsBytes] as lhsRaw, lhsRaw.cast(lhsDtype) as lhs, \
+             blocks[1].buf[:rhsBytes] as rhsRaw, rhsRaw.cast(rhsDtype) as rhs, \
+             blocks[2].buf[:resultBytes] as resultRaw, resultRaw.cast(outDtype) as result:
+            lhsRows = [lhs[r * inner:(r + 1) * inner].tolist() for r in range(rowStart, rowStop)]
+            rhsRows = [rhs[k * numCols:(k + 1) * numCols].tolist() for k in range(inner)]
+            values = _multiplyRows(lhsRows, rhsRows, numCols)
+            result[rowStart * numCols:rowStop * numCols] = array.array(outDtype, [x for row in values for x in row])
+    finally:
+        for block in blocks:
+            block.close()
+
+# Multiplies row lists in i-k-j order: each output row is accumulated from
+# whole rows of the right operand, scaled by one left operand entry.
+def _multiplyRows(lhsRows, rhsRows, numCols):
+    result = []
+    for lhsRow in lhsRows:
+        acc = [0] * numCols
+        for scalar, rhsRow in zip(lhsRow, rhsRows):
+            acc = [x + scalar * y for x, y in zip(acc, rhsRow)]
+        result.append(acc)
+    return result
+
+# Same as _multiplyRows, but walks the operands in square tiles so a strip
+# of the right operand is reused across every output row before moving on.
+def _multiplyBlocked(lhsRows, rhsRows, numCols, blockSize = _BLOCK_SIZE):
+    inner = len(rhsRows)
+    result = [[0] * numCols for _ in lhsRows]
+    for j0 in range(0, numCols, blockSize):
+        j1 = min(j0 + blockSize, numCols)
+        rhsStrip = [rhsRow[j0:j1] for rhsRow in rhsRows]
+        for k0 in range(0, inner, blockSize):
+            k1 = min(k0 + blockSize, inner)
+            rhsTile = rhsStrip[k0:k1]
+            for outRow, lhsRow in zip(result, lhsRows):
+                acc = outRow[j0:j1]
+                for scalar, rhsRow in zip(lhsRow[k0:k1], rhsTile):
+                    acc = [x + scalar * y for x, y in zip(acc, rhsRow)]
+                outRow[j0:j1] = acc
+    return result
     
     
 if __name__ == "__main__":
@@ -226,12 +719,41 @@ if __name__ == "__main__":
     print(f"\nScaled Matrix by {scaleFactor}:")
     print(m1)
 
+    # In-place operators reuse the storage of the left operand
+    print("\nIn-place operators:")
+    m5 = Matrix(2, 3)
+    m5 += m2
+    m5 -= m1
+    m5 *= 3
+    print("m5 += Matrix 2; m5 -= Matrix 1; m5 *= 3")
+    print(m5)
+    print("Matrix 2.multiply(Matrix 3, out=product)")
+    product = Matrix(2, 2)
+    m2.multiply(m3, out=product)
+    print(product)
+
+    # Deferred expressions are evaluated in a single pass
+    print("\nLazy expression (2 * Matrix 1.lazy() + Matrix 2 - m5).evaluate():")
+    print((2 * m1.lazy() + m2 - m5).evaluate())
+
     # Transpose
     print("\nTranspose:")
     print("Matrix 1:")
     print(m1)
     print("Matrix 1 Transpose:")
     print(m1.transpose())
+    print("Matrix 1 transposeView() (shares elements, no copy):")
+    print(m1.transposeView())
+
+    # NumPy interop for typed matrices
+    if numpy is not None:
+        print("\nNumPy backend:")
+        data = numpy.arange(6, dtype='d').reshape(2, 3)
+        m4 = Matrix.fromNumpy(data)
+        m4[0, 0] = 10
+        print("Matrix.fromNumpy(data) shares memory, data[0, 0] after m4[0, 0] = 10:", data[0, 0])
+        print("m4 * m4.transpose():")
+        print(m4 * m4.transpose())
 
 
     # # Determinant
@@ -0,0 +1,230 @@
+# Create a Sparse Matrix ADT with the same operations as the Matrix ADT
+# A sparse matrix is a matrix in which most of the elements are zero. Only the non-zero elements are stored, so the memory used and the cost of the
+# operations depend on the number of non-zero elements rather than on the size of the grid.
+
+#  SparseMatrix( nrows, ncols ): Creates a new sparse matrix containing nrows and ncols with every element equal to 0.
+
+#  numRows(), numCols(), getitem ( row, col ), setitem ( row, col, scalar ), scaleBy( scalar ), transpose(), add ( rhsMatrix ),
+# subtract ( rhsMatrix ), multiply ( rhsMatrix ): The same as in the Matrix ADT.
+
+#  numNonZeros(): Returns the number of non-zero elements stored in the matrix.
+
+#  fromMatrix( matrix ): Creates a sparse matrix holding the non-zero elements of a dense Matrix.
+
+#  toMatrix(): Returns a dense Matrix with the same elements.
+
+from MatrixADT import Matrix
+
+class SparseMatrix:
+    """
+    Implements a sparse matrix with the same operations as Matrix, storing
+    only the non-zero elements as a dictionary of rows keyed by row index,
+    each mapping column index to value.
+
+    Attributes:
+        _numRows (int): The number of rows.
+        _numCols (int): The number of columns.
+        _theRows (dict): Maps a row index to a dict of {column: value} for the non-zero elements of that row.
+    """
+    def __init__(self, numRows, numCols):
+        """Initializes a sparse matrix of the given size with every element equal to 0."""
+        assert numRows > 0 and numCols > 0, "Matrix dimensions must be > 0"
+        self._numRows = numRows
+        self._numCols = numCols
+        self._theRows = {}
+
+    @classmethod
+    def fromMatrix(cls, matrix):
+        """Creates a sparse matrix from the non-zero elements of a dense matrix."""
+        newMatrix = cls(matrix.numRows(), matrix.numCols())
+        for r in range(matrix.numRows()):
+            row = {c: value for c, value in enumerate(matrix._rowList(r)) if value != 0}
+            if row:
+                newMatrix._theRows[r] = row
+        return newMatrix
+
+    def toMatrix(self, dtype = None):
+        """Returns a dense Matrix with the same elements."""
+        newMatrix = Matrix(self._numRows, self._numCols, dtype)
+        for r, row in self._theRows.items():
+            values = [0] * self._numCols
+            for c, value in row.items():
+                values[c] = value
+            newMatrix._setRow(r, values)
+        return newMatrix
+
+    def numRows(self):
+        """Returns the number of rows in the matrix."""
+        return self._numRows
+
+    def numCols(self):
+        """Returns the number of columns in the matrix."""
+        return self._numCols
+
+    def numNonZeros(self):
+        """Returns the number of non-zero elements stored in the matrix."""
+        return sum(len(row) for row in self._theRows.values())
+
+    def __getitem__(self, ndxTuple):
+        row, col = ndxTuple
+        assert 0 <= row < self._numRows and 0 <= col < self._numCols, "Matrix subscript out of range."
+        theRow = self._theRows.get(row)
+        if theRow is None:
+            return 0
+        return theRow.get(col, 0)
+
+    def __setitem__(self, ndxTuple, scalar):
+        row, col = ndxTuple
+        assert 0 <= row < self._numRows and 0 <= col < self._numCols, "Matrix subscript out of range."
+        if scalar != 0:
+            self._theRows.setdefault(row, {})[col] = scalar
+        elif row in self._theRows:
+            # Setting an element to zero removes it from the storage.
+            theRow = self._theRows[row]
+            theRow.pop(col, None)
+            if not theRow:
+                del self._theRows[row]
+
+    def __add__(self, rhsMatrix):
+        return self.add(rhsMatrix)
+
+    def __sub__(self, rhsMatrix):
+        return self.subtract(rhsMatrix)
+
+    def __mul__(self, rhsMatrix):
+        return self.multiply(rhsMatrix)
+
+    def __rmul__(self, scalar):
+        newMatrix = SparseMatrix(self._numRows, self._numCols)
+        if scalar != 0:
+            for r, row in self._theRows.items():
+                newMatrix._theRows[r] = {c: value * scalar for c, value in row.items()}
+        return newMatrix
+
+    def __str__(self):
+        return str(self.toMatrix())
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __eq__(self, rhsMatrix):
+        if self.numRows() != rhsMatrix.numRows() or self.numCols() != rhsMatrix.numCols():
+            return False
+        if isinstance(rhsMatrix, SparseMatrix):
+            return self._theRows == rhsMatrix._theRows
+        return self.toMatrix() == rhsMatrix
+
+    def __ne__(self, rhsMatrix):
+        return not self == rhsMatrix
+
+    def scaleBy(self, scalar):
+        """
+        Scales all elements of the matrix by the given scalar.
+        """
+        if scalar == 0:
+            self._theRows = {}
+            return
+        for row in self._theRows.values():
+            for c in row:
+                row[c] *= scalar
+
+    def transpose(self):
+        """
+        Returns a new sparse matrix that is the transpose of this matrix.
+        """
+        newMatrix = SparseMatrix(self._numCols, self._numRows)
+        for r, row in self._theRows.items():
+            for c, value in row.items():
+                newMatrix._theRows.setdefault(c, {})[r] = value
+        return newMatrix
+
+    def add(self, rhsMatrix):
+        """
+        Adds the current matrix to another sparse matrix of the same size.
+        Returns a new sparse matrix.
+        """
+        return self._combine(rhsMatrix, 1)
+
+    def subtract(self, rhsMatrix):
+        """
+        Subtracts another sparse matrix of the same size from the current matrix.
+        Returns a new sparse matrix.
+        """
+        return self._combine(rhsMatrix, -1)
+
+    def multiply(self, rhsMatrix):
+        """
+        Multiplies the current matrix with another sparse matrix.
+        Returns a new sparse matrix.
+
+        Only pairs of non-zero elements are multiplied: each non-zero
+        element [r, k] of this matrix scales row k of rhsMatrix.
+        """
+        assert self.numCols() == rhsMatrix.numRows(), "Matrix dimensions incompatible for multiplication."
+        newMatrix = SparseMatrix(self._numRows, rhsMatrix.numCols())
+        rhsRows = rhsMatrix._theRows
+        for r, row in self._theRows.items():
+            acc = {}
+            for k, scalar in row.items():
+                rhsRow = rhsRows.get(k)
+                if rhsRow is None:
+                    continue
+                for c, value in rhsRow.items():
+                    acc[c] = acc.get(c, 0) + scalar * value
+            acc = {c: value for c, value in acc.items() if value != 0}
+            if acc:
+                newMatrix._theRows[r] = acc
+        return newMatrix
+
+    def _combine(self, rhsMatrix, sign):
+        """Returns self + sign * rhsMatrix, visiting only the non-zero elements."""
+        assert rhsMatrix.numRows() == self.numRows() and rhsMatrix.numCols() == self.numCols(), \
+               "Matrices must be of the same size."
+        newMatrix = SparseMatrix(self._numRows, self._numCols)
+        for r, row in self._theRows.items():
+            newMatrix._theRows[r] = dict(row)
+        for r, rhsRow in rhsMatrix._theRows.items():
+            row = newMatrix._theRows.setdefault(r, {})
+            for c, value in rhsRow.items():
+                total = row.get(c, 0) + sign * value
+                if total != 0:
+                    row[c] = total
+                else:
+                    row.pop(c, None)
+            if not row:
+                del newMatrix._theRows[r]
+        return newMatrix
+
+
+if __name__ == "__main__":
+    # Creating a mostly empty matrix
+    s1 = SparseMatrix(3, 4)
+    s1[0, 1] = 5
+    s1[2, 3] = 7
+    print("Sparse Matrix 1:")
+    print(s1)
+    print("Non-zero elements:", s1.numNonZeros())
+
+    s2 = SparseMatrix(4, 2)
+    s2[1, 0] = 2
+    s2[3, 1] = 3
+
+    # Addition and subtraction
+    print("\nSparse Matrix 1 + Sparse Matrix 1:")
+    print(s1 + s1)
+    print("\nSparse Matrix 1 - Sparse Matrix 1 (no non-zero elements remain):", (s1 - s1).numNonZeros())
+
+    # Multiplication
+    print("\nSparse Matrix 1 * Sparse Matrix 2:")
+    print(s1 * s2)
+
+    # Transpose and scaling
+    print("\nTranspose of Sparse Matrix 1:")
+    print(s1.transpose())
+    s1.scaleBy(2)
+    print("\nSparse Matrix 1 scaled by 2:")
+    print(s1)
+
+    # Conversion to and from the dense Matrix
+    dense = s1.toMatrix()
+    print("\nConverted to a dense Matrix and back is equal:", SparseMatrix.fromMatrix(dense) == s1)
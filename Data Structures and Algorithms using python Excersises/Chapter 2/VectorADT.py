@@ -1,15 +1,27 @@
 from ArrayADT import Array
 
 class Vector:
-    def __init__(self, capacity=2):
+    def __init__(self, capacity=2, growthFactor=2, shrinkThreshold=0.25):
         """
         Initializes a new Vector instance with the specified capacity.
+
+        The capacity is multiplied by growthFactor whenever the vector is full
+        and divided by it once the size drops to shrinkThreshold of the
+        capacity. The gap between the two keeps a size that oscillates around
+        a boundary from repeatedly growing and shrinking the storage.
         
         Args:
             capacity (int): The initial capacity of the vector.
+            growthFactor (float): How much the capacity grows when the vector is full.
+            shrinkThreshold (float): Fraction of the capacity in use below which the vector shrinks.
         """
+        assert growthFactor > 1, "The growth factor must be > 1"
+        assert 0 <= shrinkThreshold * growthFactor < 1, "The shrink threshold must be below 1 / growthFactor"
         self.array = Array(capacity)
         self.size = 0
+        self._growthFactor = growthFactor
+        self._shrinkThreshold = shrinkThreshold
+        self._minCapacity = 1
 
     def __len__(self):
         """
@@ -22,14 +34,16 @@ class Vector:
 
     def __getitem__(self, index):
         """
-        Retrieves the item at the specified index.
+        Retrieves the item at the specified index, or a list of the items in a slice.
         
         Args:
-            index (int): The index of the item to retrieve.
+            index (int or slice): The index of the item to retrieve.
             
         Returns:
             The item at the specified index.
         """
+        if isinstance(index, slice):
+            return self.array[self._arraySlice(index)]
         if index < 0 or index >= self.size:
             raise IndexError("Index out of range")
         return self.array[index]
@@ -37,43 +51,159 @@ class Vector:
     def __setitem__(self, index, value):
         """
         Sets the item at the specified index to the given value.
+
+        Assigning an iterable to a slice replaces the items in the slice, like
+        a list: with a step of 1 the vector grows or shrinks to fit the new
+        items, which are moved into place with a single block copy of the tail.
         
         Args:
-            index (int): The index of the item to set.
+            index (int or slice): The index of the item to set.
             value: The value to set the item to.
         """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            values = list(value)
+            if step == 1:
+                self._replaceRange(start, max(start, stop), values)
+            elif len(values) != len(range(start, stop, step)):
+                raise ValueError("Extended slice assignment must not change the size of the vector")
+            else:
+                self.array[self._arraySlice(index)] = values
+            return
         if index < 0 or index >= self.size:
             raise IndexError("Index out of range")
         self.array[index] = value
 
+    def capacity(self):
+        """
+        Returns the number of items the vector can hold before it must grow.
+
+        Returns:
+            int: The capacity of the vector.
+        """
+        return len(self.array)
+
     def append(self, value):
         if self.size == len(self.array):
-            self._resize()
+            self._grow(self.size + 1)
         self.array[self.size] = value
         self.size += 1
 
-    def _resize(self):
-        if self.size == len(self.array):
-            new_capacity = max(1, 2 * self.size)
-        elif self.size < len(self.array) * 0.55:
-            new_capacity = max(1, len(self.array) // 2)
-        else:
-            return  # No resizing needed
+    def extend(self, iterable):
+        """
+        Appends every item of the iterable, growing the storage at most once.
+
+        Args:
+            iterable: The items to append.
+        """
+        values = list(iterable)
+        new_size = self.size + len(values)
+        if new_size > len(self.array):
+            self._grow(new_size)
+        self.array[self.size:new_size] = values
+        self.size = new_size
+
+    def reserve(self, capacity):
+        """
+        Ensures the vector can hold at least capacity items without growing,
+        and keeps it from shrinking below that capacity.
+
+        Args:
+            capacity (int): The number of items to make room for.
+        """
+        if capacity > len(self.array):
+            self._resize(capacity)
+        self._minCapacity = max(1, capacity)
+
+    def shrink_to_fit(self):
+        """
+        Reduces the capacity to the number of items in the vector.
+        """
+        self._minCapacity = 1
+        if len(self.array) > max(1, self.size):
+            self._resize(max(1, self.size))
+
+    def _grow(self, needed):
+        # Grow geometrically so a sequence of appends costs amortized O(1).
+        self._resize(max(needed, int(len(self.array) * self._growthFactor)))
+
+    def _shrinkIfSparse(self):
+        capacity = len(self.array)
+        if capacity > self._minCapacity and self.size <= capacity * self._shrinkThreshold:
+            self._resize(max(self._minCapacity, self.size, int(capacity / self._growthFactor)))
+
+    def _resize(self, new_capacity):
         new_array = Array(new_capacity)
-        for i in range(self.size):
-            new_array[i] = self.array[i]
+        new_array.copy_from(self.array, 0, 0, self.size)
         self.array = new_array
 
     def insert(self, index, value):
         if index < 0 or index > self.size:
             raise IndexError("Index out of range")
         if self.size == len(self.array):
-            self._resize()
-        for i in range(self.size - 1, index - 1, -1):
-            self.array[i + 1] = self.array[i]
+            self._grow(self.size + 1)
+        self.array.copy_from(self.array, index, index + 1, self.size - index)
         self.array[index] = value
         self.size += 1
-        self._resize()
+
+    def insert_many(self, index, iterable):
+        """
+        Inserts every item of the iterable before the given index, shifting
+        the tail of the vector once.
+
+        Args:
+            index (int): The position of the first inserted item.
+            iterable: The items to insert.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        self._replaceRange(index, index, list(iterable))
+
+    def remove_range(self, start, stop):
+        """
+        Removes the items in the range [start, stop), shifting the tail of
+        the vector once.
+
+        Args:
+            start (int): The index of the first item to remove.
+            stop (int): One past the index of the last item to remove.
+
+        Returns:
+            list: The removed items.
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError("Index out of range")
+        removed = self[start:stop]
+        self._replaceRange(start, stop, [])
+        return removed
+
+    def _replaceRange(self, start, stop, values):
+        # Replace the items in [start, stop) with values, moving the tail once.
+        new_size = self.size - (stop - start) + len(values)
+        if new_size > len(self.array):
+            self._grow(new_size)
+        self.array.copy_from(self.array, stop, start + len(values), self.size - stop)
+        self.array[start:start + len(values)] = values
+        if new_size < self.size:
+            self.array.fill(None, new_size, self.size)
+            self.size = new_size
+            self._shrinkIfSparse()
+        else:
+            self.size = new_size
+
+    def _arraySlice(self, index):
+        # Map a slice of the vector onto the same items of the storage array.
+        ndx = range(self.size)[index]
+        if not ndx:
+            return slice(0, 0)
+        stop = ndx.stop if ndx.stop >= 0 else None
+        return slice(ndx.start, stop, ndx.step)
 
     def remove(self, index=None):
         """
@@ -95,12 +225,12 @@ class Vector:
             raise IndexError("Index out of range")
         
         removed_element = self.array[index]
-        for i in range(index, self.size - 1):
-            self.array[i] = self.array[i + 1]
+        self.array.copy_from(self.array, index + 1, index, self.size - index - 1)
         self.size -= 1
+        self.array[self.size] = None
         
         # Check if resizing is needed after removal
-        self._resize()
+        self._shrinkIfSparse()
         
         return removed_element
 
@@ -121,8 +251,203 @@ class Vector:
         Returns:
             str: A detailed string representation of the vector.
         """
-        elements_str = ', '.join(str(self.array[i]) for i in range(self.size))
-        return f"Vector([{elements_str}])"
+        elements_str = ', '.join(str(item) for item in self[:])
+        return f"{type(self).__name__}([{elements_str}])"
+
+
+class CircularVector(Vector):
+    """
+    A Vector stored as a circular buffer in the same Array storage.
+
+    Item i lives at position (head + i) % capacity, so appending, inserting
+    or removing at either end is O(1) amortized, and an edit in the middle
+    shifts only the items on the shorter side of it. Choose it over Vector
+    at construction time when most edits happen near the front.
+    """
+    def __init__(self, capacity=2, growthFactor=2, shrinkThreshold=0.25):
+        """
+        Initializes a new, empty CircularVector. The arguments are the same as for Vector.
+        """
+        super().__init__(capacity, growthFactor, shrinkThreshold)
+        self._head = 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            ndx = range(self.size)[index]
+            if ndx.step == 1:
+                # Read the one or two contiguous runs without rotating the storage.
+                items = []
+                for first, n in self._runs(ndx.start, ndx.stop):
+                    items.extend(self.array[first:first + n])
+                return items
+            capacity = len(self.array)
+            return [self.array[(self._head + i) % capacity] for i in ndx]
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        return self.array[(self._head + index) % len(self.array)]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            values = list(value)
+            if step == 1:
+                self._replaceRange(start, max(start, stop), values)
+                return
+            ndx = range(start, stop, step)
+            if len(values) != len(ndx):
+                raise ValueError("Extended slice assignment must not change the size of the vector")
+            capacity = len(self.array)
+            for i, item in zip(ndx, values):
+                self.array[(self._head + i) % capacity] = item
+            return
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+        self.array[(self._head + index) % len(self.array)] = value
+
+    def append(self, value):
+        if self.size == len(self.array):
+            self._grow(self.size + 1)
+        self.array[(self._head + self.size) % len(self.array)] = value
+        self.size += 1
+
+    def extend(self, iterable):
+        values = list(iterable)
+        new_size = self.size + len(values)
+        if new_size > len(self.array):
+            self._grow(new_size)
+        self._writeRange(self.size, values)
+        self.size = new_size
+
+    def insert(self, index, value):
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range")
+        if self.size == len(self.array):
+            self._grow(self.size + 1)
+        capacity = len(self.array)
+        if index < self.size - index:
+            # Shift the items before index one slot back and move the head with them.
+            self._moveRange(0, index, -1)
+            self._head = (self._head - 1) % capacity
+        else:
+            self._moveRange(index, self.size, 1)
+        self.array[(self._head + index) % capacity] = value
+        self.size += 1
+
+    def remove(self, index=None):
+        """
+        Removes the element at the specified index or the last element if no index is specified.
+        
+        Args:
+            index (int, optional): The index of the element to remove. Defaults to None, which removes the last element.
+            
+        Returns:
+            The removed element.
+            
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index is None:
+            index = self.size - 1
+
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range")
+
+        capacity = len(self.array)
+        removed_element = self.array[(self._head + index) % capacity]
+        if index < self.size - 1 - index:
+            # Shift the items before index one slot forward and advance the head.
+            self._moveRange(0, index, 1)
+            self.array[self._head] = None
+            self._head = (self._head + 1) % capacity
+        else:
+            self._moveRange(index + 1, self.size, -1)
+            self.array[(self._head + self.size - 1) % capacity] = None
+        self.size -= 1
+
+        self._shrinkIfSparse()
+
+        return removed_element
+
+    def _replaceRange(self, start, stop, values):
+        # Replace the items in [start, stop) with values, moving whichever
+        # side of the range holds fewer items.
+        delta = len(values) - (stop - start)
+        old_size = self.size
+        new_size = old_size + delta
+        if new_size > len(self.array):
+            self._grow(new_size)
+        capacity = len(self.array)
+        old_head = self._head
+        if start < old_size - stop:
+            self._moveRange(0, start, -delta)
+            self._head = (self._head - delta) % capacity
+        else:
+            self._moveRange(stop, old_size, delta)
+        self._writeRange(start, values)
+        if delta < 0:
+            # Clear the slots the items were moved out of: the old front
+            # slots if the head moved, otherwise the old back slots.
+            if self._head != old_head:
+                self._clearSlots(old_head, -delta)
+            else:
+                self._clearSlots((self._head + new_size) % capacity, -delta)
+            self.size = new_size
+            self._shrinkIfSparse()
+        else:
+            self.size = new_size
+
+    def _runs(self, start, stop):
+        # Returns the (storage index, count) runs holding the items at logical
+        # positions start..stop-1: one run, or two when the range wraps around.
+        count = stop - start
+        if count <= 0:
+            return []
+        capacity = len(self.array)
+        first = (self._head + start) % capacity
+        if first + count <= capacity:
+            return [(first, count)]
+        return [(first, capacity - first), (0, first + count - capacity)]
+
+    def _clearSlots(self, first, count):
+        # Sets count storage slots from first, wrapping around, to None.
+        n = min(count, len(self.array) - first)
+        self.array.fill(None, first, first + n)
+        self.array.fill(None, 0, count - n)
+
+    def _writeRange(self, start, values):
+        # Stores values at logical positions start, start + 1, ... run by run.
+        offset = 0
+        for first, n in self._runs(start, start + len(values)):
+            self.array[first:first + n] = values[offset:offset + n]
+            offset += n
+
+    def _moveRange(self, start, stop, delta):
+        # Moves the items at logical positions start..stop-1 by delta slots.
+        # The range is split where the source or the destination wraps around
+        # the end of the storage, and each contiguous run is moved with one
+        # copy_from, in an order that never overwrites items not yet moved.
+        capacity = len(self.array)
+        runs = []
+        i = start
+        while i < stop:
+            src = (self._head + i) % capacity
+            dst = (self._head + i + delta) % capacity
+            n = min(stop - i, capacity - src, capacity - dst)
+            runs.append((src, dst, n))
+            i += n
+        if delta > 0:
+            runs.reverse()
+        for src, dst, n in runs:
+            self.array.copy_from(self.array, src, dst, n)
+
+    def _resize(self, new_capacity):
+        # Copy the items in logical order, so the new storage starts at head 0.
+        new_array = Array(new_capacity)
+        first = min(self.size, len(self.array) - self._head)
+        new_array.copy_from(self.array, self._head, 0, first)
+        new_array.copy_from(self.array, 0, first, self.size - first)
+        self.array = new_array
+        self._head = 0
     
 
 if __name__ == "__main__":
@@ -158,6 +483,35 @@ if __name__ == "__main__":
 
     # Demonstrating resizing due to capacity increase
     v.append('d')
-    print("\nAppending 'd' (causes resizing):")
+    print("\nAppending 'd' (no resize, removals no longer shrink a half-full vector):")
     print(v)
     print(v.array._size)
+
+    # Bulk appends and explicit capacity management
+    v.extend(['e', 'f', 'g', 'h'])
+    print("\nAfter extending with 'e', 'f', 'g', 'h':")
+    print(v)
+    print(v.capacity())
+    v.reserve(32)
+    print("Capacity after reserve(32):", v.capacity())
+    v.shrink_to_fit()
+    print("Capacity after shrink_to_fit():", v.capacity())
+
+    # Range operations move the tail of the vector once
+    v.insert_many(1, ['p', 'q'])
+    print("\nAfter v.insert_many(1, ['p', 'q']):")
+    print(v)
+    print("v.remove_range(3, 6) removed:", v.remove_range(3, 6))
+    v[0:2] = ['y', 'z', 'w']
+    print("After v[0:2] = ['y', 'z', 'w']:")
+    print(v)
+
+    # A circular vector edits both ends in O(1)
+    cv = CircularVector(4)
+    for item in ['a', 'b', 'c']:
+        cv.append(item)
+    cv.insert(0, 'front')
+    print("\nCircularVector after appending 'a', 'b', 'c' and cv.insert(0, 'front'):")
+    print(cv)
+    print("cv.remove(0) removed:", cv.remove(0))
+    print(cv)
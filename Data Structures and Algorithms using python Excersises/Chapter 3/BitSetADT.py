@@ -0,0 +1,183 @@
+# Implementation of the Set ADT container for small non-negative integers using a bitset.
+# A set drawn from the universe 0 .. universeSize - 1 is stored as one bit per
+# possible element, packed into a bytearray of 64-bit words. Adding, removing and
+# testing an element touch a single bit, the set operations combine whole words
+# at once, and the number of elements is kept as a running count.
+import sys
+from array import array
+
+# Number of bits in each storage word.
+_WORD_BITS = 64
+
+class BitSet:
+    # Creates an empty set over the universe 0 .. universeSize - 1, optionally
+    # initialized with elements.
+    def __init__(self, universeSize, *initElements):
+        assert universeSize > 0, "The universe size must be > 0"
+        self._universeSize = universeSize
+        numWords = (universeSize + _WORD_BITS - 1) // _WORD_BITS
+        self._theBits = bytearray(numWords * _WORD_BITS // 8)
+        self._count = 0
+        for element in initElements:
+            self.add(element)
+
+    # Returns the number of values the set can hold.
+    def universeSize(self):
+        return self._universeSize
+
+    # Returns the number of items in the set.
+    def __len__(self):
+        return self._count
+
+    # Determines if an element is in the set.
+    def __contains__(self, element):
+        if not isinstance(element, int) or element < 0 or element >= self._universeSize:
+            return False
+        return (self._theBits[element >> 3] >> (element & 7)) & 1 == 1
+
+    # Adds a new unique element to the set.
+    def add(self, element):
+        assert isinstance(element, int) and 0 <= element < self._universeSize, \
+               "The element must be in the universe of the set."
+        mask = 1 << (element & 7)
+        if not self._theBits[element >> 3] & mask:
+            self._theBits[element >> 3] |= mask
+            self._count += 1
+
+    # Removes an element from the set.
+    def remove(self, element):
+        assert element in self, "The element must be in the set."
+        self._theBits[element >> 3] &= ~(1 << (element & 7)) & 0xFF
+        self._count -= 1
+
+    # Determines if two sets are equal.
+    def __eq__(self, setB):
+        if len(self) != len(setB):
+            return False
+        return self._asInt() == _bitsOf(setB)
+
+    # Determines if this set is a subset of setB.
+    def isSubsetOf(self, setB):
+        bits = self._asInt()
+        return bits & _bitsOf(setB) == bits
+
+    # Creates a new set from the union of this set and setB.
+    def union(self, setB):
+        universeSize = max(self._universeSize, _universeOf(setB))
+        return _fromInt(self._asInt() | _bitsOf(setB), universeSize)
+
+    # Creates a new set from the intersection: self set and setB.
+    def intersect(self, setB):
+        return _fromInt(self._asInt() & _bitsOf(setB), self._universeSize)
+
+    # Creates a new set from the difference: self set and setB.
+    def difference(self, setB):
+        return _fromInt(self._asInt() & ~_bitsOf(setB), self._universeSize)
+
+    # Returns an iterator for traversing the items in increasing order.
+    def __iter__(self):
+        return _BitSetIterator(self._theBits)
+
+    # String representation of the set.
+    def __str__(self):
+        return "{" + ", ".join(map(str, self)) + "}"
+
+    # Operator methods for set operations.
+    def __add__(self, setB):
+        return self.union(setB)
+
+    def __mul__(self, setB):
+        return self.intersect(setB)
+
+    def __sub__(self, setB):
+        return self.difference(setB)
+
+    def __lt__(self, setB):
+        return self.isSubsetOf(setB)
+
+    def __le__(self, setB):
+        return self.isSubsetOf(setB) or self == setB
+
+    def __gt__(self, setB):
+        return not self.isSubsetOf(setB)
+
+    def __ge__(self, setB):
+        return not self.isSubsetOf(setB) or self == setB
+
+    # Returns the bits of the set as one Python integer, so whole-set
+    # operations run as a single arbitrary-precision bitwise operation.
+    def _asInt(self):
+        return int.from_bytes(self._theBits, "little")
+
+
+# Returns the bits of any set of non-negative integers as a Python integer.
+def _bitsOf(theSet):
+    if isinstance(theSet, BitSet):
+        return theSet._asInt()
+    bits = 0
+    for element in theSet:
+        assert isinstance(element, int) and element >= 0, "BitSet elements must be non-negative integers."
+        bits |= 1 << element
+    return bits
+
+# Returns the universe size needed to hold every element of any set.
+def _universeOf(theSet):
+    if isinstance(theSet, BitSet):
+        return theSet._universeSize
+    return max(theSet, default=-1) + 1
+
+# Creates a BitSet over the given universe from the bits of a Python integer.
+def _fromInt(bits, universeSize):
+    newSet = BitSet(universeSize)
+    newSet._theBits[:] = bits.to_bytes(len(newSet._theBits), "little")
+    newSet._count = bits.bit_count()
+    return newSet
+
+
+class _BitSetIterator :
+    def __init__( self, theBits ):
+        # The bits are stored little-endian, whatever the byte order of the machine.
+        self._theWords = array( "Q", bytes( theBits ) )
+        if sys.byteorder == "big" :
+            self._theWords.byteswap()
+        self._curWord = 0
+        self._pending = 0
+
+    def __iter__( self ):
+        return self
+
+    def __next__( self ):
+        # Skip empty words, then peel off the lowest set bit of the current one.
+        while self._pending == 0 :
+            if self._curWord == len( self._theWords ) :
+                raise StopIteration
+            self._pending = self._theWords[ self._curWord ]
+            self._base = self._curWord * _WORD_BITS
+            self._curWord += 1
+        lowBit = self._pending & -self._pending
+        self._pending ^= lowBit
+        return self._base + lowBit.bit_length() - 1
+
+if __name__=='__main__':
+    s1 = BitSet(100, 1, 2, 3, 4)
+    print("Set s1 over 0..99 created with 1, 2, 3, 4:", s1)
+    s1.remove(4)
+    print("Set s1 after removing 4 (s1.remove(4)):", s1)
+
+    s3 = BitSet(100, 3, 4, 5, 64, 99)
+    print("Set s3:", s3)
+
+    print("\nUnion of s1 and s3 (s1 + s3): ", s1 + s3)
+    print("Intersection of s1 and s3 (s1 * s3): ", s1 * s3)
+    print("Difference of s3 and s1 (s3 - s1): ", s3 - s1)
+    print("Is BitSet(100, 1, 2) a subset of s1:", BitSet(100, 1, 2) <= s1)
+    print("Number of elements in s3 (len(s3)):", len(s3))
+
+    # Set algebra over a large universe
+    evens = BitSet(1000000)
+    for i in range(0, 1000000, 2):
+        evens.add(i)
+    threes = BitSet(1000000)
+    for i in range(0, 1000000, 3):
+        threes.add(i)
+    print("\nMultiples of 6 below 1000000 (len(evens * threes)):", len(evens * threes))
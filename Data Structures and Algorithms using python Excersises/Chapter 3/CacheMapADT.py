@@ -0,0 +1,340 @@
+# Implement a bounded Map for use as a lookup cache, with the same operations as
+# the list-based Map in MapADT.py.
+# CacheMap( capacity, ttl ): Creates an empty cache that holds at most capacity
+# entries and, if ttl is given, forgets each entry ttl seconds after it was added.
+# get( key, default ): Returns the value of the key, or default if it is missing.
+# hits(), misses(), evictions(): Return the number of lookups that found their
+# key, the number that did not, and the number of entries dropped by the cache.
+# hitRate(): Returns the fraction of lookups that found their key.
+# The entries are kept in an OrderedDict in least recently used order: a lookup
+# or an add moves its key to the end, and when the cache is full the entry at the
+# front is evicted (LRU). A second OrderedDict holds the expiry time of each key
+# in the order the keys were written; since every entry lives for the same ttl,
+# the expired keys are always at its front. Both orders are kept with O(1)
+# operations, so add, valueOf and remove take O(1) time.
+# Like HashMap, the cache does not inherit from Map: it keeps none of Map's
+# parallel key and value lists, so it defines every operation itself.
+import time
+from collections import OrderedDict
+
+from MapADT import _itemsOf
+
+class CacheMap:
+    def __init__(self, capacity, ttl = None, clock = time.monotonic):
+        """
+        Initialize an empty cache.
+
+        :param capacity: The largest number of entries to keep, or None for no limit.
+        :param ttl: The number of seconds an entry stays valid, or None to keep it until evicted.
+        :param clock: A function returning the current time in seconds.
+        """
+        assert capacity is None or capacity > 0, "The capacity must be > 0."
+        assert ttl is None or ttl > 0, "The ttl must be > 0."
+        self._capacity = capacity
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._expiries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """
+        Return the number of live key/value pairs in the cache.
+
+        :return: The size of the cache.
+        :rtype: int
+        """
+        self._expire()
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """
+        Determine if the cache contains a specific key. This does not count
+        as a lookup and does not change the eviction order.
+
+        :param key: The key to check for existence in the cache.
+        :return: True if the key exists in the cache, False otherwise.
+        :rtype: bool
+        """
+        self._expire()
+        return key in self._entries
+
+    def __getitem__(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        return self.valueOf(key)
+
+    def __setitem__(self, key, value):
+        """
+        Add a new entry to the cache or update the value of an existing key.
+
+        :param key: The key of the entry to add or update.
+        :param value: The value associated with the key.
+        """
+        self.add(key, value)
+
+    def add(self, key, value):
+        """
+        Add a new key/value pair to the cache, or update the value of an
+        existing key. The key becomes the most recently used one and, if the
+        cache is full, the least recently used entry is evicted.
+
+        :param key: The key of the entry to add.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        :rtype: bool
+        """
+        self._expire()
+        entries = self._entries
+        isNew = key not in entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if self._ttl is not None:
+            self._expiries[key] = self._clock() + self._ttl
+            self._expiries.move_to_end(key)
+        if self._capacity is not None and len(entries) > self._capacity:
+            oldKey, oldValue = entries.popitem(last = False)
+            self._expiries.pop(oldKey, None)
+            self._evictions += 1
+        return isNew
+
+    def remove(self, key):
+        """
+        Remove the entry associated with the given key.
+
+        :param key: The key of the entry to remove.
+        """
+        self._expire()
+        assert key in self._entries, "Invalid map key."
+        del self._entries[key]
+        self._expiries.pop(key, None)
+
+    def valueOf(self, key):
+        """
+        Return the value associated with a given key and mark the key as the
+        most recently used one.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        self._expire()
+        if key not in self._entries:
+            self._misses += 1
+        assert key in self._entries, "Invalid map key."
+        return self.get(key)
+
+    def get(self, key, default = None):
+        """
+        Return the value associated with a given key, or a default value if
+        the key is not in the cache. The lookup is counted as a hit or a miss.
+
+        :param key: The key whose associated value is to be returned.
+        :param default: The value to return if the key is missing.
+        :return: The value associated with the key, or default.
+        """
+        self._expire()
+        entries = self._entries
+        if key in entries:
+            self._hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self._misses += 1
+        return default
+
+    def update(self, other):
+        """
+        Add the entries of another map or of an iterable of (key, value)
+        pairs, evicting entries as needed.
+
+        :param other: A map, or an iterable of (key, value) pairs.
+        """
+        for key, value in _itemsOf(other):
+            self.add(key, value)
+
+    @classmethod
+    def from_items(cls, iterable, capacity = None, ttl = None, clock = time.monotonic):
+        """
+        Create a new cache from a map or an iterable of (key, value) pairs.
+
+        :param iterable: A map, or an iterable of (key, value) pairs.
+        :param capacity: The largest number of entries to keep, or None for no limit.
+        :param ttl: The number of seconds an entry stays valid, or None.
+        :param clock: A function returning the current time in seconds.
+        :return: A new cache holding the entries.
+        """
+        newMap = cls(capacity, ttl, clock)
+        newMap.update(iterable)
+        return newMap
+
+    def __iter__(self):
+        """
+        Return an iterator for traversing the keys in the cache, from the
+        least to the most recently used. The iterator walks a copy of the
+        keys, so the values can be looked up while iterating even though
+        each lookup reorders the entries.
+
+        :return: An iterator for the cache's keys.
+        """
+        self._expire()
+        return iter(list(self._entries))
+
+    def keys(self):
+        """
+        Return a view of the keys in the cache. The view is live: do not
+        look up values while iterating over it, since lookups reorder the
+        entries; iterate over the cache itself instead.
+
+        :return: A view of the cache's keys.
+        """
+        self._expire()
+        return self._entries.keys()
+
+    def values(self):
+        """
+        Return a view of the values in the cache.
+
+        :return: A view of the cache's values.
+        """
+        self._expire()
+        return self._entries.values()
+
+    def items(self):
+        """
+        Return a view of the (key, value) pairs in the cache.
+
+        :return: A view of the cache's entries.
+        """
+        self._expire()
+        return self._entries.items()
+
+    def capacity(self):
+        """
+        Return the largest number of entries the cache keeps.
+
+        :return: The capacity, or None if the cache is unbounded.
+        """
+        return self._capacity
+
+    def hits(self):
+        """
+        Return the number of lookups that found their key.
+
+        :rtype: int
+        """
+        return self._hits
+
+    def misses(self):
+        """
+        Return the number of lookups that did not find their key.
+
+        :rtype: int
+        """
+        return self._misses
+
+    def evictions(self):
+        """
+        Return the number of entries dropped because the cache was full or
+        because they expired.
+
+        :rtype: int
+        """
+        return self._evictions
+
+    def hitRate(self):
+        """
+        Return the fraction of lookups that found their key.
+
+        :return: The hit rate, or 0.0 if there were no lookups.
+        :rtype: float
+        """
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def resetStats(self):
+        """
+        Reset the hit, miss and eviction counters to zero.
+        """
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _expire(self):
+        """
+        Drop the entries whose ttl has passed. Used internally.
+        """
+        expiries = self._expiries
+        if not expiries:
+            return
+        now = self._clock()
+        while expiries:
+            key, deadline = next(iter(expiries.items()))
+            if deadline > now:
+                break
+            del expiries[key]
+            del self._entries[key]
+            self._evictions += 1
+
+    def __str__(self):
+        """
+        Return a string representation of the cache in dictionary format,
+        from the least to the most recently used entry.
+
+        :return: A string representing the cache.
+        :rtype: str
+        """
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self):
+        """
+        Return a formal string representation of the cache object.
+
+        :return: A string representing the cache object.
+        :rtype: str
+        """
+        return f"CacheMap{str(self)}"
+
+    def __add__(self, other):
+        """
+        Combine the cache with another map into a new cache with the same
+        capacity, ttl and clock. The values of other win for keys found in
+        both, and the entries added last are the ones kept if the result is
+        over capacity.
+
+        :param other: The map to combine with.
+        :return: A new cache containing the combined entries.
+        """
+        newMap = CacheMap.from_items(self.items(), self._capacity, self._ttl, self._clock)
+        newMap.update(other)
+        return newMap
+
+
+# Test code
+if __name__ == "__main__":
+    # An LRU cache with room for three entries
+    cache = CacheMap(3)
+    for course, credits in [("CS101", 3), ("CS102", 4), ("CS103", 5)]:
+        cache.add(course, credits)
+    print("\nInitial cache:", cache)
+
+    cache.valueOf("CS101")
+    cache.add("NT110", 3)
+    print("After using CS101 and adding NT110 (CS102 is evicted):", cache)
+
+    print("\nLookup of 'CS102' (cache.get('CS102', 0)):", cache.get("CS102", 0))
+    print("Hits, misses, evictions:", cache.hits(), cache.misses(), cache.evictions())
+    print("Hit rate:", cache.hitRate())
+
+    # A cache whose entries expire, driven by a fake clock
+    now = [0.0]
+    timed = CacheMap(None, ttl = 10, clock = lambda: now[0])
+    timed.add("session", "abc")
+    now[0] = 5.0
+    print("\nAfter 5 seconds, 'session' in timed:", "session" in timed)
+    now[0] = 10.0
+    print("After 10 seconds, 'session' in timed:", "session" in timed)
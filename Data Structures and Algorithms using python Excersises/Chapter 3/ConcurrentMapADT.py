@@ -0,0 +1,222 @@
+# Implement a thread-safe Map ADT, with the same operations as the list-based Map
+# in MapADT.py, that many threads can update at the same time.
+# get_or_add( key, value ): Returns the value of the key, first adding it with
+# the given value if the key is not in the map, as one atomic step.
+# update( key, fn ): Replaces the value of the key with fn( value ) as one atomic
+# step and returns the new value.
+# The entries are split into a fixed number of shards by the hash of the key.
+# Each shard is a dictionary guarded by its own lock (lock striping), so threads
+# that work on keys in different shards never wait for each other and only
+# operations on the same shard are serialized.
+import threading
+
+# The shard of a key is the top bits of its hash times this odd constant
+# (Fibonacci hashing), as in HashMapADT.py.
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# Marks that no default value was given to update.
+_NO_DEFAULT = object()
+
+class ConcurrentMap:
+    def __init__(self, numShards = 16):
+        """
+        Initialize an empty map.
+
+        :param numShards: The number of independently locked shards, a power of two.
+        """
+        assert numShards > 0 and numShards & (numShards - 1) == 0, \
+               "The number of shards must be a power of two."
+        self._shards = [dict() for i in range(numShards)]
+        self._locks = [threading.Lock() for i in range(numShards)]
+        self._shift = 64 - (numShards.bit_length() - 1)
+
+    def __len__(self):
+        """
+        Return the number of key/value pairs in the map. Other threads may
+        change the map while the shards are being counted.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                total += len(shard)
+        return total
+
+    def __contains__(self, key):
+        """
+        Determine if the map contains a specific key.
+
+        :param key: The key to check for existence in the map.
+        :return: True if the key exists in the map, False otherwise.
+        :rtype: bool
+        """
+        ndx = self._shardOf(key)
+        with self._locks[ndx]:
+            return key in self._shards[ndx]
+
+    def __getitem__(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        return self.valueOf(key)
+
+    def __setitem__(self, key, value):
+        """
+        Add a new entry to the map or update the value of an existing key.
+
+        :param key: The key of the entry to add or update.
+        :param value: The value associated with the key.
+        """
+        self.add(key, value)
+
+    def add(self, key, value):
+        """
+        Add a new key/value pair to the map. If the key already exists,
+        update the value associated with the key.
+
+        :param key: The key of the entry to add.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        :rtype: bool
+        """
+        ndx = self._shardOf(key)
+        shard = self._shards[ndx]
+        with self._locks[ndx]:
+            isNew = key not in shard
+            shard[key] = value
+        return isNew
+
+    def remove(self, key):
+        """
+        Remove the entry associated with the given key.
+
+        :param key: The key of the entry to remove.
+        """
+        ndx = self._shardOf(key)
+        shard = self._shards[ndx]
+        with self._locks[ndx]:
+            assert key in shard, "Invalid map key."
+            del shard[key]
+
+    def valueOf(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        ndx = self._shardOf(key)
+        shard = self._shards[ndx]
+        with self._locks[ndx]:
+            assert key in shard, "Invalid map key."
+            return shard[key]
+
+    def get_or_add(self, key, value):
+        """
+        Return the value associated with a key, adding the key with the
+        given value first if it is not in the map. No other thread can add
+        the key in between.
+
+        :param key: The key to look up.
+        :param value: The value to add if the key is missing.
+        :return: The value associated with the key after the call.
+        """
+        ndx = self._shardOf(key)
+        shard = self._shards[ndx]
+        with self._locks[ndx]:
+            return shard.setdefault(key, value)
+
+    def update(self, key, fn, default = _NO_DEFAULT):
+        """
+        Replace the value of a key with fn applied to its current value,
+        holding the shard lock so no other update to the key is lost.
+        fn must not use the map itself.
+
+        :param key: The key whose value is updated.
+        :param fn: A function from the current value to the new value.
+        :param default: The value passed to fn if the key is missing. If it
+                        is not given, the key must be in the map.
+        :return: The new value associated with the key.
+        """
+        ndx = self._shardOf(key)
+        shard = self._shards[ndx]
+        with self._locks[ndx]:
+            if key in shard:
+                value = fn(shard[key])
+            else:
+                assert default is not _NO_DEFAULT, "Invalid map key."
+                value = fn(default)
+            shard[key] = value
+        return value
+
+    def __iter__(self):
+        """
+        Return an iterator for traversing the keys in the map. Each shard
+        is copied under its lock when the iterator reaches it, so the map
+        can be changed while it is being iterated.
+
+        :return: An iterator for the map's keys.
+        """
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                keys = list(shard)
+            yield from keys
+
+    def _shardOf(self, key):
+        """
+        Return the index of the shard that holds a key. Used internally.
+        """
+        return ((hash(key) * _MULTIPLIER) & _MASK64) >> self._shift
+
+    def __str__(self):
+        """
+        Return a string representation of the map in dictionary format.
+
+        :return: A string representing the map.
+        :rtype: str
+        """
+        entries = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                entries.extend(shard.items())
+        return "{" + ", ".join(f"{key}: {value}" for key, value in entries) + "}"
+
+    def __repr__(self):
+        """
+        Return a formal string representation of the map object.
+
+        :return: A string representing the map object.
+        :rtype: str
+        """
+        return f"ConcurrentMap{str(self)}"
+
+
+# Test code
+if __name__ == "__main__":
+    m = ConcurrentMap()
+    m.add("CS101", 3)
+    m.add("CS102", 4)
+    print("\nInitial Map:", m)
+    print("m.get_or_add('CS103', 5):", m.get_or_add("CS103", 5))
+    print("m.get_or_add('CS101', 9):", m.get_or_add("CS101", 9))
+    print("m.update('CS102', lambda credits: credits + 1):", m.update("CS102", lambda credits: credits + 1))
+
+    # Several threads counting events into the same map
+    counts = ConcurrentMap()
+    def countEvents(threadId):
+        for i in range(10000):
+            counts.update(i % 100, lambda n: n + 1, 0)
+
+    threads = [threading.Thread(target = countEvents, args = (t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print("\n8 threads x 10000 events over 100 keys, total count:",
+          sum(counts[key] for key in counts))
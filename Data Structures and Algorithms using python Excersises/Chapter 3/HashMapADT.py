@@ -0,0 +1,306 @@
+# Implement the Map ADT with a hash table using open addressing, with the same
+# operations as the list-based Map in MapADT.py.
+# Keys are placed in a table of slots by their hash value and collisions are
+# resolved with linear probing, so contains, add, valueOf and remove take O(1)
+# time on average instead of scanning every entry.
+# When the table becomes too full it is not rebuilt in one step. A larger table
+# is allocated and every later add or remove moves a few entries from the old
+# table into it (incremental rehashing). Until the old table is empty, lookups
+# check both tables, so no single operation has to pay for copying the whole map.
+
+# Marks a slot that has never been used; a search can stop here.
+_EMPTY = object()
+
+# Marks a slot whose entry was removed or moved; a search must probe past it.
+_DELETED = object()
+
+# The home slot of a key is the top bits of its hash times this odd constant
+# (Fibonacci hashing), which spreads out keys whose low bits are all equal.
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# A table grows once more than this fraction of its slots are in use.
+_MAX_LOAD_FACTOR = 2 / 3
+
+# Number of old-table slots migrated by each add or remove during a rehash.
+_MIGRATE_SLOTS = 8
+
+class HashMap:
+    def __init__(self):
+        """
+        Initialize an empty map.
+        """
+        self._table = _HashTable(8)
+        self._oldTable = None
+        self._migrateNdx = 0
+
+    def __len__(self):
+        """
+        Return the number of key/value pairs in the map.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        if self._oldTable is None:
+            return self._table.size
+        return self._table.size + self._oldTable.size
+
+    def __contains__(self, key):
+        """
+        Determine if the map contains a specific key.
+
+        :param key: The key to check for existence in the map.
+        :return: True if the key exists in the map, False otherwise.
+        :rtype: bool
+        """
+        table, ndx = self._findPosition(key)
+        return table is not None
+
+    def __getitem__(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        return self.valueOf(key)
+
+    def __setitem__(self, key, value):
+        """
+        Add a new entry to the map or update the value of an existing key.
+
+        :param key: The key of the entry to add or update.
+        :param value: The value associated with the key.
+        """
+        self.add(key, value)
+
+    def add(self, key, value):
+        """
+        Add a new key/value pair to the map. If the key already exists,
+        update the value associated with the key.
+
+        :param key: The key of the entry to add.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        :rtype: bool
+        """
+        self._migrate()
+        keyHash = hash(key)
+        table, ndx = self._findPosition(key, keyHash)
+        if table is not None:
+            table.values[ndx] = value
+            return False
+        self._table.insert(key, value, keyHash)
+        if self._table.used > len(self._table.keys) * _MAX_LOAD_FACTOR:
+            self._startRehash()
+        return True
+
+    def remove(self, key):
+        """
+        Remove the entry associated with the given key.
+
+        :param key: The key of the entry to remove.
+        """
+        self._migrate()
+        table, ndx = self._findPosition(key)
+        assert table is not None, "Invalid map key."
+        table.delete(ndx)
+
+    def valueOf(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        table, ndx = self._findPosition(key)
+        assert table is not None, "Invalid map key."
+        return table.values[ndx]
+
+    def __iter__(self):
+        """
+        Return an iterator for traversing the keys in the map.
+
+        :return: An iterator for the map's keys.
+        :rtype: _HashMapIterator
+        """
+        tables = [self._table] if self._oldTable is None else [self._table, self._oldTable]
+        return _HashMapIterator(tables)
+
+    def _findPosition(self, key, keyHash = None):
+        """
+        Find the table and slot holding a key. Used internally.
+
+        :param key: The key to find.
+        :param keyHash: The hash of the key, if it is already known.
+        :return: A (table, slot) pair, or (None, None) if the key is not in the map.
+        :rtype: tuple
+        """
+        if keyHash is None:
+            keyHash = hash(key)
+        ndx = self._table.find(key, keyHash)
+        if ndx is not None:
+            return self._table, ndx
+        if self._oldTable is not None:
+            ndx = self._oldTable.find(key, keyHash)
+            if ndx is not None:
+                return self._oldTable, ndx
+        return None, None
+
+    def _startRehash(self):
+        """
+        Replace the current table with a larger one, leaving its entries to
+        be migrated a few at a time. Used internally.
+        """
+        if self._oldTable is not None:
+            # The previous rehash has not finished yet; complete it first.
+            self._migrate(len(self._oldTable.keys))
+        capacity = len(self._table.keys)
+        while self._table.size > capacity * _MAX_LOAD_FACTOR / 2:
+            capacity *= 2
+        self._oldTable = self._table
+        self._table = _HashTable(capacity)
+        self._migrateNdx = 0
+
+    def _migrate(self, numSlots = _MIGRATE_SLOTS):
+        """
+        Move the entries in the next numSlots slots of the old table into
+        the current table. Used internally.
+        """
+        oldTable = self._oldTable
+        if oldTable is None:
+            return
+        stop = min(self._migrateNdx + numSlots, len(oldTable.keys))
+        for ndx in range(self._migrateNdx, stop):
+            key = oldTable.keys[ndx]
+            if key is not _EMPTY and key is not _DELETED:
+                self._table.insert(key, oldTable.values[ndx], hash(key))
+                oldTable.delete(ndx)
+        self._migrateNdx = stop
+        if stop == len(oldTable.keys):
+            self._oldTable = None
+
+    def __str__(self):
+        """
+        Return a string representation of the map in dictionary format.
+
+        :return: A string representing the map.
+        :rtype: str
+        """
+        return "{" + ", ".join(f"{key}: {self.valueOf(key)}" for key in self) + "}"
+
+    def __repr__(self):
+        """
+        Return a formal string representation of the map object.
+
+        :return: A string representing the map object.
+        :rtype: str
+        """
+        return f"HashMap{str(self)}"
+
+    # Operator methods for addition. Combine both maps
+    def __add__( self, other ):
+        """
+        Combine both maps
+
+        :param other: The map to combine with.
+        :return: A new map containing the combined entries.
+        """
+        newMap = HashMap()
+        for key in self:
+            newMap.add( key, self.valueOf( key ) )
+        for key in other:
+            newMap.add( key, other.valueOf( key ) )
+        return newMap
+
+
+# One open-addressing table: parallel lists of keys and values.
+class _HashTable :
+    __slots__ = ( "keys", "values", "shift", "size", "used" )
+
+    def __init__( self, capacity ):
+        self.keys = [ _EMPTY ] * capacity
+        self.values = [ None ] * capacity
+        self.shift = 64 - ( capacity.bit_length() - 1 )
+        self.size = 0       # Slots holding a live entry.
+        self.used = 0       # Slots holding a live entry or a _DELETED marker.
+
+    # Returns the slot holding the key, or None.
+    def find( self, key, keyHash ):
+        keys = self.keys
+        mask = len( keys ) - 1
+        ndx = ( ( keyHash * _MULTIPLIER ) & _MASK64 ) >> self.shift
+        while True:
+            slot = keys[ ndx ]
+            if slot is _EMPTY:
+                return None
+            if slot is not _DELETED and ( slot is key or slot == key ):
+                return ndx
+            ndx = ( ndx + 1 ) & mask
+
+    # Stores a key that is known not to be in the table.
+    def insert( self, key, value, keyHash ):
+        keys = self.keys
+        mask = len( keys ) - 1
+        ndx = ( ( keyHash * _MULTIPLIER ) & _MASK64 ) >> self.shift
+        while keys[ ndx ] is not _EMPTY and keys[ ndx ] is not _DELETED:
+            ndx = ( ndx + 1 ) & mask
+        if keys[ ndx ] is _EMPTY:
+            self.used += 1
+        keys[ ndx ] = key
+        self.values[ ndx ] = value
+        self.size += 1
+
+    # Removes the entry in the given slot.
+    def delete( self, ndx ):
+        self.keys[ ndx ] = _DELETED
+        self.values[ ndx ] = None
+        self.size -= 1
+
+
+# Iterator class for the hash map: visits the keys of each table in turn.
+class _HashMapIterator :
+    def __init__( self, tables ):
+        self._tables = tables
+        self._curTable = 0
+        self._curNdx = 0
+
+    def __iter__( self ):
+        return self
+
+    def __next__( self ):
+        while self._curTable < len( self._tables ):
+            keys = self._tables[ self._curTable ].keys
+            while self._curNdx < len( keys ):
+                key = keys[ self._curNdx ]
+                self._curNdx += 1
+                if key is not _EMPTY and key is not _DELETED:
+                    return key
+            self._curTable += 1
+            self._curNdx = 0
+        raise StopIteration
+
+# Test code
+if __name__ == "__main__":
+    # Create a map and add some entries
+    m = HashMap()
+    m.add("CS101", 3)
+    m.add("CS102", 4)
+    m.add("CS103", 5)
+    m.add("NT110", 3)
+
+    print("\nInitial Map:")
+    print(m)
+
+    print("\nNumber of entries:", len(m))
+    print("\nValue of 'CS102':", m["CS102"])
+
+    print("\nRemove an entry (m.remove('CS101'))")
+    m.remove("CS101")
+    print(m)
+
+    # Many keys: the table grows incrementally as entries are added
+    big = HashMap()
+    for i in range(100000):
+        big.add(i, i * i)
+    print("\nAdded 100000 keys, len(big):", len(big), "big[99999]:", big[99999])
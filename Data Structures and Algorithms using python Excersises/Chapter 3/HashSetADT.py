@@ -0,0 +1,232 @@
+# Implementation of the Set ADT container using a hash table with open addressing.
+# The elements are stored directly in the slots of a Python list and collisions are
+# resolved with linear probing, so add, remove and the membership test take O(1)
+# time on average instead of the O(n) scan of the list-based Set.
+
+# Marks a slot that has never been used; a search can stop here.
+_EMPTY = object()
+
+# Marks a slot whose element was removed; a search must probe past it.
+_DELETED = object()
+
+# The home slot of an element is the top bits of its hash times this odd
+# constant (Fibonacci hashing), which spreads out keys such as multiples of a
+# power of two that would all collide if the low bits were used directly.
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+class HashSet:
+    # The table grows once more than this fraction of its slots are in use.
+    MAX_LOAD_FACTOR = 2 / 3
+
+    # Creates an empty set instance or initializes it with elements.
+    def __init__(self, *initElements):
+        self._table = [_EMPTY] * 8
+        self._shift = 64 - 3    # 64 - log2 of the table size.
+        self._size = 0
+        self._used = 0      # Slots holding an element or a _DELETED marker.
+        for element in initElements:
+            self.add(element)
+
+    # Returns the number of items in the set.
+    def __len__(self):
+        return self._size
+
+    # Determines if an element is in the set.
+    def __contains__(self, element):
+        return self._findSlot(element) is not None
+
+    # Adds a new unique element to the set.
+    def add(self, element):
+        table = self._table
+        mask = len(table) - 1
+        ndx = ((hash(element) * _MULTIPLIER) & _MASK64) >> self._shift
+        firstDeleted = None
+        while True:
+            slot = table[ndx]
+            if slot is _EMPTY:
+                break
+            if slot is _DELETED:
+                if firstDeleted is None:
+                    firstDeleted = ndx
+            elif slot is element or slot == element:
+                return
+            ndx = (ndx + 1) & mask
+        if firstDeleted is not None:
+            # Reuse the first tombstone on the probe path.
+            table[firstDeleted] = element
+        else:
+            table[ndx] = element
+            self._used += 1
+        self._size += 1
+        if self._used > len(table) * self.MAX_LOAD_FACTOR:
+            self._rehash()
+
+    # Removes an element from the set.
+    def remove(self, element):
+        ndx = self._findSlot(element)
+        assert ndx is not None, "The element must be in the set."
+        self._table[ndx] = _DELETED
+        self._size -= 1
+
+    # Determines if two sets are equal.
+    def __eq__(self, setB):
+        if len(self) != len(setB):
+            return False
+        else :
+            return self.isSubsetOf( setB )
+
+    # Determines if this set is a subset of setB.
+    def isSubsetOf(self, setB):
+        if len(self) > len(setB):
+            return False
+        for element in self:
+            if element not in setB:
+                return False
+        return True
+
+    # Creates a new set from the union of this set and setB.
+    def union(self, setB):
+        newSet = self._copy()
+        for element in setB:
+            newSet.add(element)
+        return newSet
+
+    # Creates a new set from the intersection: self set and setB.
+    def intersect(self, setB):
+        newSet = HashSet()
+        # Probe with the elements of the smaller set.
+        smaller, larger = (self, setB) if len(self) <= len(setB) else (setB, self)
+        for element in smaller:
+            if element in larger:
+                newSet.add(element)
+        return newSet
+
+    # Creates a new set from the difference: self set and setB.
+    def difference(self, setB):
+        newSet = HashSet()
+        for element in self:
+            if element not in setB:
+                newSet.add(element)
+        return newSet
+
+    # Returns an iterator for traversing the items in the table.
+    def __iter__(self):
+        return _HashSetIterator(self._table)
+
+    # String representation of the set.
+    def __str__(self):
+        return "{" + ", ".join(map(str, self)) + "}"
+
+    # Operator methods for set operations.
+    def __add__(self, setB):
+        return self.union(setB)
+
+    def __mul__(self, setB):
+        return self.intersect(setB)
+
+    def __sub__(self, setB):
+        return self.difference(setB)
+
+    def __lt__(self, setB):
+        return self.isSubsetOf(setB)
+
+    def __le__(self, setB):
+        return self.isSubsetOf(setB) or self == setB
+
+    def __gt__(self, setB):
+        return not self.isSubsetOf(setB)
+
+    def __ge__(self, setB):
+        return not self.isSubsetOf(setB) or self == setB
+
+    # Returns the slot holding the element, or None if it is not in the set.
+    def _findSlot(self, element):
+        table = self._table
+        mask = len(table) - 1
+        ndx = ((hash(element) * _MULTIPLIER) & _MASK64) >> self._shift
+        while True:
+            slot = table[ndx]
+            if slot is _EMPTY:
+                return None
+            if slot is not _DELETED and (slot is element or slot == element):
+                return ndx
+            ndx = (ndx + 1) & mask
+
+    # Returns a copy of this set with the same table layout.
+    def _copy(self):
+        newSet = HashSet()
+        newSet._table = list(self._table)
+        newSet._shift = self._shift
+        newSet._size = self._size
+        newSet._used = self._used
+        return newSet
+
+    # Rebuilds the table without the deleted markers, doubling its size until
+    # the live elements use at most half of the maximum load.
+    def _rehash(self):
+        oldTable = self._table
+        capacity = len(oldTable)
+        while self._size > capacity * self.MAX_LOAD_FACTOR / 2:
+            capacity *= 2
+        self._table = [_EMPTY] * capacity
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self._size = 0
+        mask = capacity - 1
+        table = self._table
+        for element in oldTable:
+            if element is not _EMPTY and element is not _DELETED:
+                ndx = ((hash(element) * _MULTIPLIER) & _MASK64) >> self._shift
+                while table[ndx] is not _EMPTY:
+                    ndx = (ndx + 1) & mask
+                table[ndx] = element
+                self._size += 1
+        self._used = self._size
+
+
+class _HashSetIterator :
+    def __init__( self, theTable ):
+        self._theTable = theTable
+        self._curSlot = 0
+
+    def __iter__( self ):
+        return self
+
+    def __next__( self ):
+        while self._curSlot < len( self._theTable ) :
+            item = self._theTable[ self._curSlot ]
+            self._curSlot += 1
+            if item is not _EMPTY and item is not _DELETED :
+                return item
+        raise StopIteration
+
+if __name__=='__main__':
+    s1 = HashSet()
+    print("Set s1 before adding elements:", s1)
+    for i in range(1, 5):
+        s1.add(i)
+    print("Set s1 after adding elements:", s1)
+
+    # Addition of element already present in set
+    s1.add(4)
+    print("Set s1 after adding element already present (s1.add(4)):", s1)
+
+    # Removal of element present in set
+    s1.remove(4)
+    print("Set s1 after removing element present (s1.remove(4)):", s1)
+
+    s2 = HashSet(1,2,3)
+    s3 = HashSet(3,4,5)
+    print("Set s2:", s2, "Set s3:", s3)
+
+    print("\nUnion of s1 and s3 (s1 + s3): ", s1 + s3)
+    print("Intersection of s1 and s3 (s1 * s3): ", s1 * s3)
+    print("Difference of s1 and s3 (s1 - s3): ", s1 - s3)
+    print("Is s2 a subset of s1 (s2 <= s1):", s2 <= s1)
+    print("Is s1 equal to s2 (s1 == s2):", s1 == s2)
+
+    # Building a large set takes linear time
+    big = HashSet()
+    for i in range(100000):
+        big.add(i)
+    print("\nAdded 100000 elements, len(big):", len(big), "99999 in big:", 99999 in big)
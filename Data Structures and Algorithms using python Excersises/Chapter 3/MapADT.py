@@ -15,13 +15,21 @@
 # key must exist in the map or an exception is raised.
 # iterator (): Creates and returns an iterator that can be used to iterate over
 # the keys in the map.
+# update( other ): Adds every entry of another map, or of an iterable of
+# (key, value) pairs, replacing the values of keys that already exist.
+# Map.from_items( iterable ): Creates a new map from (key, value) pairs.
+from itertools import chain
 
+# The entries are kept in two parallel lists: the key of entry i is _keyList[i]
+# and its value is _valueList[i]. This avoids allocating an object per entry,
+# and lets a key be found with the built-in list search.
 class Map:
     def __init__(self):
         """
         Initialize an empty map.
         """
-        self._entryList = list()
+        self._keyList = list()
+        self._valueList = list()
 
     def __len__(self):
         """
@@ -30,7 +38,7 @@ class Map:
         :return: The size of the map.
         :rtype: int
         """
-        return len(self._entryList)
+        return len(self._keyList)
 
     def __contains__(self, key):
         """
@@ -74,11 +82,11 @@ class Map:
         """
         ndx = self._findPosition(key)
         if ndx is not None:
-            self._entryList[ndx].value = value
+            self._valueList[ndx] = value
             return False
         else:
-            entry = _MapEntry(key, value)
-            self._entryList.append(entry)
+            self._keyList.append(key)
+            self._valueList.append(value)
             return True
 
     def remove(self, key):
@@ -90,7 +98,8 @@ class Map:
         """
         ndx = self._findPosition(key)
         assert ndx is not None, "Invalid map key."
-        self._entryList.pop(ndx)
+        self._keyList.pop(ndx)
+        self._valueList.pop(ndx)
 
     def valueOf(self, key):
         """
@@ -102,16 +111,104 @@ class Map:
         """
         ndx = self._findPosition(key)
         assert ndx is not None, "Invalid map key."
-        return self._entryList[ndx].value
+        return self._valueList[ndx]
 
     def __iter__(self):
         """
         Return an iterator for traversing the keys in the map.
         
         :return: An iterator for the map's keys.
-        :rtype: _MapIterator
         """
-        return _MapIterator(self._entryList)
+        return iter(self._keyList)
+
+    def update(self, other):
+        """
+        Add the entries of another map or of an iterable of (key, value)
+        pairs, replacing the values of keys that are already in the map.
+        The keys of this map are indexed in a temporary dictionary, so the
+        whole update takes O(n + m) time instead of one scan per new key.
+
+        :param other: A map, or an iterable of (key, value) pairs.
+        """
+        keyList = self._keyList
+        valueList = self._valueList
+        try:
+            index = {key: ndx for ndx, key in enumerate(keyList)}
+        except TypeError:
+            # Some key is unhashable; fall back to scanning for each key.
+            index = None
+        for key, value in _itemsOf(other):
+            if index is not None:
+                try:
+                    ndx = index.get(key)
+                except TypeError:
+                    index = None
+                    ndx = self._findPosition(key)
+            else:
+                ndx = self._findPosition(key)
+            if ndx is not None:
+                valueList[ndx] = value
+            else:
+                if index is not None:
+                    index[key] = len(keyList)
+                keyList.append(key)
+                valueList.append(value)
+
+    @classmethod
+    def from_items(cls, iterable):
+        """
+        Create a new map from a map or an iterable of (key, value) pairs.
+        When a key appears more than once, its last value is kept. The pairs
+        are collected first so that the key and value lists are allocated
+        once at their final size.
+
+        :param iterable: A map, or an iterable of (key, value) pairs.
+        :return: A new map holding the entries.
+        """
+        newMap = cls()
+        entries = dict()
+        pairs = iter(_itemsOf(iterable))
+        rest = None
+        for key, value in pairs:
+            try:
+                entries[key] = value
+            except TypeError:
+                # An unhashable key: add it and the remaining pairs with update.
+                rest = chain([(key, value)], pairs)
+                break
+        newMap._keyList = list(entries)
+        newMap._valueList = list(entries.values())
+        if rest is not None:
+            newMap.update(rest)
+        return newMap
+
+    def keys(self):
+        """
+        Return a view of the keys in the map. The view reflects later
+        changes to the map and does not copy the keys.
+
+        :return: A view of the map's keys.
+        :rtype: _MapKeysView
+        """
+        return _MapKeysView(self)
+
+    def values(self):
+        """
+        Return a view of the values in the map.
+
+        :return: A view of the map's values.
+        :rtype: _MapValuesView
+        """
+        return _MapValuesView(self)
+
+    def items(self):
+        """
+        Return a view of the (key, value) pairs in the map.
+
+        :return: A view of the map's entries.
+        :rtype: _MapItemsView
+        """
+        return _MapItemsView(self)
 
     def _findPosition(self, key):
         """
@@ -121,11 +218,10 @@ class Map:
         :return: The index position of the key if found, None otherwise.
         :rtype: int or None
         """
-        n = len(self)
-        for i in range(n):
-            if self._entryList[i].key == key:
-                return i
-        return None
+        try:
+            return self._keyList.index(key)
+        except ValueError:
+            return None
 
     def __str__(self):
         """
@@ -134,13 +230,7 @@ class Map:
         :return: A string representing the map.
         :rtype: str
         """
-        result = "{"
-        for i, entry in enumerate(self._entryList):
-            result += f"{entry.key}: {entry.value}"
-            if i < len(self._entryList) - 1:
-                result += ", "
-        result += "}"
-        return result
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
 
     def __repr__(self):
         """
@@ -154,42 +244,58 @@ class Map:
     # Operator methods for addition. Combine both maps
     def __add__( self, other ):
         """
-        Combine both maps
+        Combine both maps in O(n + m) time. The values of other win for
+        keys found in both maps.
 
         :param other: The map to combine with.
         :type other: Map
         :return: A new map containing the combined entries.
         """
-        newMap = Map()
-        for entry in self:
-            newMap.add( entry.key, entry.value )
-        for entry in other:
-            newMap.add( entry.key, entry.value )
+        newMap = Map.from_items( self.items() )
+        newMap.update( other )
         return newMap
-    
 
-# Iterator class for map.
-class _MapIterator :
-    def __init__( self, entryList ):
-        self._entryList = entryList
-        self._curNdx = 0
 
+# Returns the (key, value) pairs of a map, or the argument itself if it is
+# already an iterable of pairs.
+def _itemsOf( other ):
+    if hasattr( other, "items" ):
+        return other.items()
+    if hasattr( other, "valueOf" ):
+        return ( ( key, other.valueOf( key ) ) for key in other )
+    return other
+
+# Views of a map. They hold a reference to the map rather than a copy of its
+# entries, so they are cheap to create and always reflect the current contents.
+class _MapView :
+    def __init__( self, theMap ):
+        self._theMap = theMap
+
+    def __len__( self ):
+        return len( self._theMap )
+
+class _MapKeysView( _MapView ) :
     def __iter__( self ):
-        return self
-    
-    def __next__( self ):
-        if self._curNdx < len( self._entryList ):
-            entry = self._entryList[ self._curNdx ]
-            self._curNdx += 1
-            return entry.key
-        else:
-            raise StopIteration
+        return iter( self._theMap._keyList )
 
-# Storage class for holding the key/value pairs.
-class _MapEntry :
-    def __init__( self, key, value ):
-        self.key = key
-        self.value = value
+    def __contains__( self, key ):
+        return key in self._theMap
+
+class _MapValuesView( _MapView ) :
+    def __iter__( self ):
+        return iter( self._theMap._valueList )
+
+    def __contains__( self, value ):
+        return value in self._theMap._valueList
+
+class _MapItemsView( _MapView ) :
+    def __iter__( self ):
+        return zip( self._theMap._keyList, self._theMap._valueList )
+
+    def __contains__( self, item ):
+        key, value = item
+        ndx = self._theMap._findPosition( key )
+        return ndx is not None and self._theMap._valueList[ ndx ] == value
 
 # Test code
 if __name__ == "__main__":
@@ -218,6 +324,8 @@ if __name__ == "__main__":
         print(f" {m[key]}", end="")
     print()
 
+    print("\nItems (m.items()):", list(m.items()))
+
     print("\nRemove an entry (m.remove('CS101'))")
     m.remove("CS101")
 
@@ -225,4 +333,10 @@ if __name__ == "__main__":
     print(m)  # Display the map again to show the effect of removal
 
     print("\nNumber of entries after removal:", len(m))
+
+    # Merging and bulk loading
+    other = Map.from_items([("CS102", 6), ("MA201", 4)])
+    print("\nMerged with", other, "(m + other):", m + other)
+    m.update({"PH150": 2})
+    print("After m.update({'PH150': 2}):", m)
     
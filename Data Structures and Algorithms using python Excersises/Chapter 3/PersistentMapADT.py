@@ -0,0 +1,601 @@
+# Implement a Map ADT stored in a file, with the same operations as the
+# list-based Map in MapADT.py, for maps whose keys and values do not fit in
+# memory.
+# PersistentMap( path ): Opens the map stored in the file at path, creating an
+# empty one if the file does not exist.
+# flush(): Forces the entries written so far to disk.
+# compact(): Rewrites the file keeping only the live entries.
+# close(): Marks the index as up to date and closes the files.
+# The file is an append-only log of records. Adding a key appends its key and
+# value, and removing a key appends a delete record, so old records are never
+# changed. Values are read back through a memory map of the log when they are
+# asked for.
+# The index from keys to their latest records is a second file next to the
+# log: an open-addressing hash table with linear probing whose slots hold a
+# 64-bit hash of the key and the offset of its record. The table is updated in
+# place through a memory map, so it takes no memory per key and opening the map
+# only checks the header of the index. A slot matches a key only if the key
+# stored in the log record is the same, so hash collisions are harmless. If the
+# map was not closed cleanly, the index is rebuilt by scanning the log.
+# Keys are compared by their pickled form, so equal keys must pickle to the
+# same bytes: str, bytes, int and tuples of these work, but 1 and True, or 0.0
+# and -0.0, are different keys.
+# When more than compactRatio of the log is taken by replaced or deleted
+# records, the log is compacted into a new file.
+import io
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from hashlib import blake2b
+
+# The log starts with a magic number and a random generation id. Each
+# compaction starts a new generation, so an index built for an older log is
+# never applied to a newer one.
+_MAGIC = b"PMAP"
+_FILE_HEADER = struct.Struct("<4s8s")
+
+# Each record is a CRC-32 of the rest of the record, the record kind, the key
+# and value lengths, and then the pickled key and value.
+_CRC = struct.Struct("<I")
+_RECORD_FIELDS = struct.Struct("<BII")
+_RECORD_HEADER_SIZE = _CRC.size + _RECORD_FIELDS.size
+_PUT = 1
+_DELETE = 0
+
+# The index file starts with its magic number, the generation of the log it
+# describes, the number of slots, of live keys and of slots in use, the length
+# of the log it covers, the number of dead bytes in the log, and a flag that is
+# set only while the map is closed cleanly. The slots follow the header, each a
+# (key hash, record offset) pair.
+_INDEX_MAGIC = b"PIDX"
+_INDEX_HEADER = struct.Struct("<4s8sQQQQQB")
+_INDEX_SLOTS_START = 64
+_SLOT = struct.Struct("<QQ")
+
+# Record offsets are never below the log header, so these two offsets mark a
+# slot that has never been used and one whose key was removed.
+_EMPTY = 0
+_REMOVED = 1
+
+# A table grows once more than this fraction of its slots are in use, and is
+# rebuilt with at most a third of its slots in use.
+_MAX_LOAD_FACTOR = 2 / 3
+_MIN_CAPACITY = 64
+
+# Logs smaller than this are never compacted automatically.
+_MIN_COMPACT_BYTES = 1 << 20
+
+class PersistentMap:
+    def __init__(self, path, compactRatio = 0.5):
+        """
+        Open the map stored at path, creating an empty map if needed.
+
+        :param path: The path of the log file. The index is kept at path + ".index".
+        :param compactRatio: The fraction of dead bytes in the log that triggers a compaction.
+        """
+        assert 0 < compactRatio <= 1, "The compaction ratio must be in (0, 1]."
+        self._path = path
+        self._indexPath = path + ".index"
+        self._compactRatio = compactRatio
+        self._deadBytes = 0
+        self._map = None
+        self._index = None
+        self._open()
+
+    def __len__(self):
+        """
+        Return the number of key/value pairs in the map.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        return self._index.size
+
+    def __contains__(self, key):
+        """
+        Determine if the map contains a specific key.
+
+        :param key: The key to check for existence in the map.
+        :return: True if the key exists in the map, False otherwise.
+        :rtype: bool
+        """
+        keyBytes = _keyBytes(key)
+        ndx, offset = self._find(keyBytes, _hashOf(keyBytes))
+        return offset is not None
+
+    def __getitem__(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        return self.valueOf(key)
+
+    def __setitem__(self, key, value):
+        """
+        Add a new entry to the map or update the value of an existing key.
+
+        :param key: The key of the entry to add or update.
+        :param value: The value associated with the key.
+        """
+        self.add(key, value)
+
+    def add(self, key, value):
+        """
+        Add a new key/value pair to the map. If the key already exists,
+        update the value associated with the key.
+
+        :param key: The key of the entry to add.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        :rtype: bool
+        """
+        keyBytes = _keyBytes(key)
+        valueBytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        offset = self._append(_PUT, keyBytes, valueBytes)
+        old = self._store(keyBytes, _hashOf(keyBytes), offset)
+        if old is not None:
+            self._deadBytes += self._recordSizeAt(old)
+            self._compactIfSparse()
+        return old is None
+
+    def remove(self, key):
+        """
+        Remove the entry associated with the given key.
+
+        :param key: The key of the entry to remove.
+        """
+        keyBytes = _keyBytes(key)
+        ndx, old = self._find(keyBytes, _hashOf(keyBytes))
+        assert old is not None, "Invalid map key."
+        self._append(_DELETE, keyBytes, b"")
+        self._index.delete(ndx)
+        self._deadBytes += self._recordSizeAt(old) + _RECORD_HEADER_SIZE + len(keyBytes)
+        self._compactIfSparse()
+
+    def valueOf(self, key):
+        """
+        Return the value associated with a given key, read from the file.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        keyBytes = _keyBytes(key)
+        ndx, offset = self._find(keyBytes, _hashOf(keyBytes))
+        assert offset is not None, "Invalid map key."
+        keyLength, valueLength = self._lengthsAt(offset)
+        return pickle.loads(self._read(offset + _RECORD_HEADER_SIZE + keyLength, valueLength))
+
+    def __iter__(self):
+        """
+        Return an iterator for traversing the keys in the map, in the order
+        of their slots in the index. The map must not be changed while it is
+        being iterated.
+
+        :return: An iterator for the map's keys.
+        """
+        index = self._index
+        for ndx in range(index.capacity):
+            keyHash, offset = index.slot(ndx)
+            if offset > _REMOVED:
+                keyLength, valueLength = self._lengthsAt(offset)
+                yield pickle.loads(self._read(offset + _RECORD_HEADER_SIZE, keyLength))
+
+    def flush(self):
+        """
+        Force the records written so far to disk.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def compact(self):
+        """
+        Rewrite the log keeping only the latest record of every live key,
+        together with a new index for it.
+        """
+        self._file.flush()
+        self._remap()
+        generation = os.urandom(8)
+        tmpPath = self._path + ".compact"
+        tmpIndexPath = self._indexPath + ".compact"
+        index = self._index
+        newIndex = _IndexFile.create(tmpIndexPath, generation, _capacityFor(index.size))
+        with open(tmpPath, "wb") as out:
+            out.write(_FILE_HEADER.pack(_MAGIC, generation))
+            pos = _FILE_HEADER.size
+            for ndx in range(index.capacity):
+                keyHash, offset = index.slot(ndx)
+                if offset > _REMOVED:
+                    # Records are copied as they are; their checksums stay valid.
+                    size = self._recordSizeAt(offset)
+                    out.write(self._map[offset:offset + size])
+                    newIndex.insert(keyHash, pos)
+                    pos += size
+            out.flush()
+            os.fsync(out.fileno())
+        newIndex.close()
+        self._closeFile()
+        # A crash between the two renames leaves an index of the old
+        # generation, which is rebuilt when the map is opened.
+        os.replace(tmpPath, self._path)
+        os.replace(tmpIndexPath, self._indexPath)
+        self._file = open(self._path, "r+b")
+        self._generation = generation
+        self._index = _IndexFile(self._indexPath)
+        self._deadBytes = 0
+        self._end = pos
+        self._remap()
+
+    def close(self):
+        """
+        Write the records to disk, mark the index as up to date for them
+        and close the map.
+        """
+        if self._file is None:
+            return
+        self.flush()
+        self._index.covered = self._end
+        self._index.deadBytes = self._deadBytes
+        self._index.clean = True
+        self._closeFile()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def __str__(self):
+        """
+        Return a string representation of the map in dictionary format.
+
+        :return: A string representing the map.
+        :rtype: str
+        """
+        return "{" + ", ".join(f"{key}: {self.valueOf(key)}" for key in self) + "}"
+
+    def __repr__(self):
+        """
+        Return a formal string representation of the map object.
+
+        :return: A string representing the map object.
+        :rtype: str
+        """
+        return f"PersistentMap{str(self)}"
+
+    def _open(self):
+        """
+        Open or create the log and its index. Used internally.
+        """
+        if not os.path.exists(self._path) or os.path.getsize(self._path) < _FILE_HEADER.size:
+            with open(self._path, "wb") as out:
+                out.write(_FILE_HEADER.pack(_MAGIC, os.urandom(8)))
+        self._file = open(self._path, "r+b")
+        magic, self._generation = _FILE_HEADER.unpack(self._file.read(_FILE_HEADER.size))
+        assert magic == _MAGIC, "The file is not a persistent map."
+        self._remap()
+        if not self._openIndex():
+            self._index = _IndexFile.create(self._indexPath, self._generation, _MIN_CAPACITY)
+            self._scan(_FILE_HEADER.size)
+        # Until close marks it clean again, a crash leaves the index to be rebuilt.
+        self._index.clean = False
+        self._index.writeHeader()
+
+    def _openIndex(self):
+        """
+        Open the index file if it was closed cleanly for the current log.
+        Used internally.
+
+        :return: True if the index can be used as it is.
+        :rtype: bool
+        """
+        if not os.path.exists(self._indexPath):
+            return False
+        try:
+            index = _IndexFile(self._indexPath)
+        except (OSError, ValueError):
+            # An empty, truncated or foreign index: rebuild it from the log.
+            return False
+        if not index.clean or index.generation != self._generation or \
+           index.covered != len(self._map):
+            index.close()
+            return False
+        self._index = index
+        self._deadBytes = index.deadBytes
+        self._end = index.covered
+        return True
+
+    def _scan(self, pos):
+        """
+        Apply the records of the log from pos to its end to the index.
+        An incomplete or corrupt record at the end, left by an interrupted
+        write, is cut off. Used internally.
+
+        :param pos: The offset of the first record to read.
+        """
+        data = self._map
+        size = len(data)
+        while pos + _RECORD_HEADER_SIZE <= size:
+            (crc,) = _CRC.unpack_from(data, pos)
+            kind, keyLength, valueLength = _RECORD_FIELDS.unpack_from(data, pos + _CRC.size)
+            keyStart = pos + _RECORD_HEADER_SIZE
+            end = keyStart + keyLength + valueLength
+            if end > size or zlib.crc32(data[pos + _CRC.size:end]) != crc:
+                break
+            keyBytes = data[keyStart:keyStart + keyLength]
+            keyHash = _hashOf(keyBytes)
+            if kind == _PUT:
+                old = self._store(keyBytes, keyHash, pos)
+            else:
+                ndx, old = self._find(keyBytes, keyHash)
+                if old is not None:
+                    self._index.delete(ndx)
+                self._deadBytes += end - pos
+            if old is not None:
+                self._deadBytes += self._recordSizeAt(old)
+            pos = end
+        if pos < size:
+            self._closeMap()
+            self._file.truncate(pos)
+            self._remap()
+        self._end = pos
+
+    def _find(self, keyBytes, keyHash):
+        """
+        Search the index for a key. Used internally.
+
+        :return: The slot holding the key and the offset of its latest
+                 record, or the slot where the key would be added and None.
+        """
+        index = self._index
+        mask = index.capacity - 1
+        ndx = keyHash & mask
+        free = None
+        while True:
+            slotHash, offset = index.slot(ndx)
+            if offset == _EMPTY:
+                return (ndx if free is None else free), None
+            if offset == _REMOVED:
+                if free is None:
+                    free = ndx
+            elif slotHash == keyHash and self._keyAt(offset) == keyBytes:
+                return ndx, offset
+            ndx = (ndx + 1) & mask
+
+    def _store(self, keyBytes, keyHash, offset):
+        """
+        Point the index entry of a key at a new record, adding the entry if
+        the key is new. Used internally.
+
+        :return: The offset of the key's previous record, or None.
+        """
+        index = self._index
+        if index.used + 1 > index.capacity * _MAX_LOAD_FACTOR:
+            self._rehash()
+            index = self._index
+        ndx, old = self._find(keyBytes, keyHash)
+        if old is None:
+            index.fill(ndx, keyHash, offset)
+        else:
+            index.setSlot(ndx, keyHash, offset)
+        return old
+
+    def _rehash(self):
+        """
+        Move the index into a new table sized for its live keys, dropping
+        the removed slots. Used internally.
+        """
+        index = self._index
+        tmpPath = self._indexPath + ".tmp"
+        newIndex = _IndexFile.create(tmpPath, self._generation, _capacityFor(index.size))
+        for ndx in range(index.capacity):
+            keyHash, offset = index.slot(ndx)
+            if offset > _REMOVED:
+                newIndex.insert(keyHash, offset)
+        newIndex.close()
+        index.close()
+        os.replace(tmpPath, self._indexPath)
+        self._index = _IndexFile(self._indexPath)
+
+    def _read(self, start, length):
+        """
+        Return length bytes of the log from start. Records appended since
+        the log was mapped are read from the file, and the log is mapped
+        again once it has doubled in size. Used internally.
+        """
+        end = start + length
+        if end > len(self._map):
+            if self._end < 2 * len(self._map):
+                self._file.seek(start)
+                return self._file.read(length)
+            self._file.flush()
+            self._remap()
+        return self._map[start:end]
+
+    def _lengthsAt(self, offset):
+        """
+        Return the key and value lengths of the record at offset. Used
+        internally.
+        """
+        kind, keyLength, valueLength = _RECORD_FIELDS.unpack(
+            self._read(offset + _CRC.size, _RECORD_FIELDS.size))
+        return keyLength, valueLength
+
+    def _keyAt(self, offset):
+        """
+        Return the pickled key of the record at offset. Used internally.
+        """
+        keyLength, valueLength = self._lengthsAt(offset)
+        return self._read(offset + _RECORD_HEADER_SIZE, keyLength)
+
+    def _recordSizeAt(self, offset):
+        """
+        Return the size of the record at offset. Used internally.
+        """
+        keyLength, valueLength = self._lengthsAt(offset)
+        return _RECORD_HEADER_SIZE + keyLength + valueLength
+
+    def _append(self, kind, keyBytes, valueBytes):
+        """
+        Append a record to the end of the log. Used internally.
+
+        :return: The offset of the new record.
+        :rtype: int
+        """
+        fields = _RECORD_FIELDS.pack(kind, len(keyBytes), len(valueBytes))
+        crc = zlib.crc32(valueBytes, zlib.crc32(keyBytes, zlib.crc32(fields)))
+        offset = self._end
+        self._file.seek(offset)
+        self._file.write(_CRC.pack(crc) + fields + keyBytes + valueBytes)
+        self._end = offset + _RECORD_HEADER_SIZE + len(keyBytes) + len(valueBytes)
+        return offset
+
+    def _compactIfSparse(self):
+        """
+        Compact the log once enough of it is dead. Used internally.
+        """
+        if self._deadBytes > _MIN_COMPACT_BYTES and self._deadBytes > self._end * self._compactRatio:
+            self.compact()
+
+    def _remap(self):
+        """
+        Map the whole file into memory again after it has grown. Used
+        internally.
+        """
+        self._closeMap()
+        self._map = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+
+    def _closeMap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _closeFile(self):
+        self._closeMap()
+        self._file.close()
+        self._file = None
+        self._index.close()
+        self._index = None
+
+
+# The index of a log: an open-addressing table of (key hash, record offset)
+# slots in a memory-mapped file. The header fields are kept as attributes
+# and written back by writeHeader and close.
+class _IndexFile :
+    def __init__( self, path ):
+        self._file = open( path, "r+b" )
+        try:
+            self._map = mmap.mmap( self._file.fileno(), 0 )
+        except ( OSError, ValueError ):
+            self._file.close()
+            raise
+        capacity = 0
+        if len( self._map ) >= _INDEX_SLOTS_START:
+            ( magic, self.generation, capacity, self.size, self.used,
+              self.covered, self.deadBytes, clean ) = _INDEX_HEADER.unpack_from( self._map, 0 )
+        if capacity == 0 or magic != _INDEX_MAGIC or capacity & ( capacity - 1 ) or \
+           len( self._map ) != _INDEX_SLOTS_START + capacity * _SLOT.size:
+            self._map.close()
+            self._file.close()
+            raise ValueError( "The file is not a persistent map index." )
+        self.capacity = capacity
+        self.clean = bool( clean )
+
+    # Creates an empty index file with the given number of slots and opens it.
+    @classmethod
+    def create( cls, path, generation, capacity ):
+        with open( path, "wb" ) as out:
+            out.write( _INDEX_HEADER.pack( _INDEX_MAGIC, generation, capacity, 0, 0,
+                                           _FILE_HEADER.size, 0, False ) )
+            # The new slots read as zeros, which marks them _EMPTY.
+            out.truncate( _INDEX_SLOTS_START + capacity * _SLOT.size )
+        return cls( path )
+
+    # Returns the (key hash, record offset) pair in a slot.
+    def slot( self, ndx ):
+        return _SLOT.unpack_from( self._map, _INDEX_SLOTS_START + ndx * _SLOT.size )
+
+    def setSlot( self, ndx, keyHash, offset ):
+        _SLOT.pack_into( self._map, _INDEX_SLOTS_START + ndx * _SLOT.size, keyHash, offset )
+
+    # Stores a new key in a slot found by a search.
+    def fill( self, ndx, keyHash, offset ):
+        if self.slot( ndx )[ 1 ] == _EMPTY:
+            self.used += 1
+        self.setSlot( ndx, keyHash, offset )
+        self.size += 1
+
+    # Stores a key that is known not to be in the table.
+    def insert( self, keyHash, offset ):
+        mask = self.capacity - 1
+        ndx = keyHash & mask
+        while self.slot( ndx )[ 1 ] > _REMOVED:
+            ndx = ( ndx + 1 ) & mask
+        self.fill( ndx, keyHash, offset )
+
+    # Removes the entry in the given slot.
+    def delete( self, ndx ):
+        self.setSlot( ndx, 0, _REMOVED )
+        self.size -= 1
+
+    # Writes the header fields to the file and forces them to disk.
+    def writeHeader( self ):
+        _INDEX_HEADER.pack_into( self._map, 0, _INDEX_MAGIC, self.generation, self.capacity,
+                                 self.size, self.used, self.covered, self.deadBytes, self.clean )
+        self._map.flush( 0, _INDEX_SLOTS_START )
+
+    # Forces the slots to disk before the header, so a clean header is never
+    # on disk ahead of the slots it describes, and closes the file.
+    def close( self ):
+        self._map.flush()
+        self.writeHeader()
+        self._map.close()
+        self._file.close()
+
+
+# Returns the pickled form of a key. The pickler keeps no memo, so a key
+# always pickles to the same bytes, however its parts are shared.
+def _keyBytes(key):
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(key)
+    return buffer.getvalue()
+
+# Returns a 64-bit hash of a pickled key that is the same in every process.
+def _hashOf(keyBytes):
+    return int.from_bytes(blake2b(keyBytes, digest_size = 8).digest(), "little")
+
+# Returns the smallest table size that keeps at most a third of its slots in use.
+def _capacityFor(size):
+    capacity = _MIN_CAPACITY
+    while capacity < 3 * (size + 1):
+        capacity *= 2
+    return capacity
+
+# Test code
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "courses.pmap")
+    with PersistentMap(path) as m:
+        m.add("CS101", 3)
+        m.add("CS102", 4)
+        m.add("CS103", 5)
+        m.add("NT110", 3)
+        m.remove("CS101")
+        print("\nMap written to", path, ":", m)
+
+    # Reopening maps the index file instead of reading the whole log
+    with PersistentMap(path) as m:
+        print("Map after reopening:", m)
+        print("Value of 'CS102':", m["CS102"])
+
+        # Many updates to the same keys leave dead records behind
+        for i in range(200000):
+            m.add(i % 1000, i)
+        print("\nAfter 200000 updates of 1000 keys, len(m):", len(m),
+              "log size:", os.path.getsize(path), "bytes")
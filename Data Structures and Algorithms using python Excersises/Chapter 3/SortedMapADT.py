@@ -0,0 +1,311 @@
+# Implement a sorted Map ADT using a skip list. It has the same operations as
+# the list-based Map in MapADT.py, and keeps the keys in sorted order so that it
+# can also answer ordered queries. The keys must be comparable with < and ==.
+# floor( key ): Returns the largest key in the map that is <= key, or None.
+# ceiling( key ): Returns the smallest key in the map that is >= key, or None.
+# range( lo, hi ): Creates and returns an iterator over the (key, value) pairs
+# with lo <= key < hi, in increasing key order.
+# min(), max(): Return the smallest and the largest key in the map.
+# A skip list is a sorted linked list in which each node also links forward
+# several levels, skipping over a random, geometrically shrinking number of
+# nodes on each level. Searches start on the highest level and drop down,
+# so lookups, updates and the ordered queries take O(log n) expected time.
+import random
+
+# Upper bound on the number of levels of a node.
+_MAX_LEVEL = 32
+
+# Probability that a node is also linked on the next level up.
+_LEVEL_PROBABILITY = 0.25
+
+class SortedMap:
+    def __init__(self):
+        """
+        Initialize an empty map.
+        """
+        self._head = _SkipNode(None, None, _MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random()
+
+    def __len__(self):
+        """
+        Return the number of key/value pairs in the map.
+
+        :return: The size of the map.
+        :rtype: int
+        """
+        return self._size
+
+    def __contains__(self, key):
+        """
+        Determine if the map contains a specific key.
+
+        :param key: The key to check for existence in the map.
+        :return: True if the key exists in the map, False otherwise.
+        :rtype: bool
+        """
+        return self._findNode(key) is not None
+
+    def __getitem__(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        return self.valueOf(key)
+
+    def __setitem__(self, key, value):
+        """
+        Add a new entry to the map or update the value of an existing key.
+
+        :param key: The key of the entry to add or update.
+        :param value: The value associated with the key.
+        """
+        self.add(key, value)
+
+    def add(self, key, value):
+        """
+        Add a new key/value pair to the map. If the key already exists,
+        update the value associated with the key.
+
+        :param key: The key of the entry to add.
+        :param value: The value associated with the key.
+        :return: True if a new key was added, False if an existing key was updated.
+        :rtype: bool
+        """
+        update = self._findPredecessors(key)
+        node = update[0].next[0]
+        if node is not None and node.key == key:
+            node.value = value
+            return False
+        level = self._randomLevel()
+        if level > self._level:
+            for i in range(self._level, level):
+                update[i] = self._head
+            self._level = level
+        newNode = _SkipNode(key, value, level)
+        for i in range(level):
+            newNode.next[i] = update[i].next[i]
+            update[i].next[i] = newNode
+        self._size += 1
+        return True
+
+    def remove(self, key):
+        """
+        Remove the entry associated with the given key.
+
+        :param key: The key of the entry to remove.
+        """
+        update = self._findPredecessors(key)
+        node = update[0].next[0]
+        assert node is not None and node.key == key, "Invalid map key."
+        for i in range(len(node.next)):
+            update[i].next[i] = node.next[i]
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+
+    def valueOf(self, key):
+        """
+        Return the value associated with a given key.
+
+        :param key: The key whose associated value is to be returned.
+        :return: The value associated with the key.
+        """
+        node = self._findNode(key)
+        assert node is not None, "Invalid map key."
+        return node.value
+
+    def floor(self, key):
+        """
+        Return the largest key that is less than or equal to the given key.
+
+        :param key: The key to search for.
+        :return: The floor key, or None if every key is greater than key.
+        """
+        node = self._head
+        for i in reversed(range(self._level)):
+            while node.next[i] is not None and not key < node.next[i].key:
+                node = node.next[i]
+        return None if node is self._head else node.key
+
+    def ceiling(self, key):
+        """
+        Return the smallest key that is greater than or equal to the given key.
+
+        :param key: The key to search for.
+        :return: The ceiling key, or None if every key is less than key.
+        """
+        node = self._findPredecessors(key)[0].next[0]
+        return None if node is None else node.key
+
+    def range(self, lo, hi):
+        """
+        Return an iterator over the entries with lo <= key < hi.
+
+        :param lo: The smallest key to include.
+        :param hi: The key at which to stop (not included).
+        :return: An iterator of (key, value) pairs in increasing key order.
+        :rtype: _SortedMapIterator
+        """
+        start = self._findPredecessors(lo)[0].next[0]
+        return _SortedMapIterator(start, hi, True)
+
+    def min(self):
+        """
+        Return the smallest key in the map.
+
+        :return: The smallest key.
+        """
+        assert self._size > 0, "The map is empty."
+        return self._head.next[0].key
+
+    def max(self):
+        """
+        Return the largest key in the map.
+
+        :return: The largest key.
+        """
+        assert self._size > 0, "The map is empty."
+        node = self._head
+        for i in reversed(range(self._level)):
+            while node.next[i] is not None:
+                node = node.next[i]
+        return node.key
+
+    def __iter__(self):
+        """
+        Return an iterator for traversing the keys in the map in sorted order.
+
+        :return: An iterator for the map's keys.
+        :rtype: _SortedMapIterator
+        """
+        return _SortedMapIterator(self._head.next[0])
+
+    def _findPredecessors(self, key):
+        """
+        Find, on every level, the last node whose key is less than the given
+        key. Used internally.
+
+        :param key: The key to search for.
+        :return: A list holding the predecessor node on each level.
+        :rtype: list
+        """
+        update = [self._head] * _MAX_LEVEL
+        node = self._head
+        for i in reversed(range(self._level)):
+            while node.next[i] is not None and node.next[i].key < key:
+                node = node.next[i]
+            update[i] = node
+        return update
+
+    def _findNode(self, key):
+        """
+        Find the node holding a key. Used internally.
+
+        :param key: The key to find.
+        :return: The node holding the key if found, None otherwise.
+        """
+        node = self._head
+        for i in reversed(range(self._level)):
+            while node.next[i] is not None and node.next[i].key < key:
+                node = node.next[i]
+        node = node.next[0]
+        if node is not None and node.key == key:
+            return node
+        return None
+
+    def _randomLevel(self):
+        """
+        Pick the number of levels for a new node. Used internally.
+        """
+        level = 1
+        while level < _MAX_LEVEL and self._random.random() < _LEVEL_PROBABILITY:
+            level += 1
+        return level
+
+    def __str__(self):
+        """
+        Return a string representation of the map in dictionary format.
+
+        :return: A string representing the map.
+        :rtype: str
+        """
+        entries = _SortedMapIterator(self._head.next[0], None, True)
+        return "{" + ", ".join(f"{key}: {value}" for key, value in entries) + "}"
+
+    def __repr__(self):
+        """
+        Return a formal string representation of the map object.
+
+        :return: A string representing the map object.
+        :rtype: str
+        """
+        return f"SortedMap{str(self)}"
+
+    # Operator methods for addition. Combine both maps
+    def __add__( self, other ):
+        """
+        Combine both maps
+
+        :param other: The map to combine with.
+        :return: A new map containing the combined entries.
+        """
+        newMap = SortedMap()
+        for key in self:
+            newMap.add( key, self.valueOf( key ) )
+        for key in other:
+            newMap.add( key, other.valueOf( key ) )
+        return newMap
+
+
+# Iterator class for the sorted map: follows the bottom level of the skip list.
+class _SortedMapIterator :
+    def __init__( self, startNode, stopKey = None, withValues = False ):
+        self._curNode = startNode
+        self._stopKey = stopKey
+        self._withValues = withValues
+
+    def __iter__( self ):
+        return self
+
+    def __next__( self ):
+        node = self._curNode
+        if node is None or ( self._stopKey is not None and not node.key < self._stopKey ):
+            raise StopIteration
+        self._curNode = node.next[ 0 ]
+        if self._withValues:
+            return ( node.key, node.value )
+        return node.key
+
+# Storage class for a key/value pair and its forward links on each level.
+class _SkipNode :
+    __slots__ = ( "key", "value", "next" )
+
+    def __init__( self, key, value, level ):
+        self.key = key
+        self.value = value
+        self.next = [ None ] * level
+
+# Test code
+if __name__ == "__main__":
+    m = SortedMap()
+    for hour, count in [(9, 12), (13, 7), (10, 4), (17, 9), (11, 3)]:
+        m.add(hour, count)
+
+    print("\nSorted Map:")
+    print(m)
+
+    print("\nSmallest and largest keys (m.min(), m.max()):", m.min(), m.max())
+    print("Floor of 12 (m.floor(12)):", m.floor(12))
+    print("Ceiling of 12 (m.ceiling(12)):", m.ceiling(12))
+
+    print("\nEntries from 10 up to 14 (m.range(10, 14)):")
+    for key, value in m.range(10, 14):
+        print(f" {key}: {value}")
+
+    print("\nRemove an entry (m.remove(10))")
+    m.remove(10)
+    print(m)
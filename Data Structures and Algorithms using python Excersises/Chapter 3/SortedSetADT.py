@@ -0,0 +1,150 @@
+# Implementation of the Set ADT container using a sorted Python list.
+# The elements must be comparable with < and ==. Keeping them in order lets
+# membership use binary search and lets the set operations merge two sorted
+# lists in a single pass, so they take O(n + m) time instead of O(n * m).
+from bisect import bisect_left
+
+from SetADT import Set
+
+class SortedSet(Set):
+    # Creates an empty set instance or initializes it with elements.
+    def __init__(self, *initElements):
+        self._theElements = _unique(sorted(initElements))
+
+    # Determines if an element is in the set.
+    def __contains__(self, element):
+        ndx = bisect_left(self._theElements, element)
+        return ndx < len(self._theElements) and self._theElements[ndx] == element
+
+    # Adds a new unique element to the set, keeping the elements sorted.
+    def add(self, element):
+        ndx = bisect_left(self._theElements, element)
+        if ndx == len(self._theElements) or self._theElements[ndx] != element:
+            self._theElements.insert(ndx, element)
+
+    # Removes an element from the set.
+    def remove(self, element):
+        ndx = bisect_left(self._theElements, element)
+        assert ndx < len(self._theElements) and self._theElements[ndx] == element, \
+               "The element must be in the set."
+        del self._theElements[ndx]
+
+    # Determines if two sets are equal.
+    def __eq__(self, setB):
+        if len(self) != len(setB):
+            return False
+        return self._theElements == _sortedElements(setB)
+
+    # Determines if this set is a subset of setB.
+    def isSubsetOf(self, setB):
+        listA = self._theElements
+        listB = _sortedElements(setB)
+        if len(listA) > len(listB):
+            return False
+        b = 0
+        for element in listA:
+            while b < len(listB) and listB[b] < element:
+                b += 1
+            if b == len(listB) or listB[b] != element:
+                return False
+            b += 1
+        return True
+
+    # Creates a new set from the union of this set and setB.
+    def union(self, setB):
+        listA = self._theElements
+        listB = _sortedElements(setB)
+        merged = []
+        a = b = 0
+        while a < len(listA) and b < len(listB):
+            if listA[a] < listB[b]:
+                merged.append(listA[a])
+                a += 1
+            elif listB[b] < listA[a]:
+                merged.append(listB[b])
+                b += 1
+            else:
+                merged.append(listA[a])
+                a += 1
+                b += 1
+        merged.extend(listA[a:])
+        merged.extend(listB[b:])
+        return _fromSorted(merged)
+
+    # Creates a new set from the intersection: self set and setB.
+    def intersect(self, setB):
+        listA = self._theElements
+        listB = _sortedElements(setB)
+        common = []
+        a = b = 0
+        while a < len(listA) and b < len(listB):
+            if listA[a] < listB[b]:
+                a += 1
+            elif listB[b] < listA[a]:
+                b += 1
+            else:
+                common.append(listA[a])
+                a += 1
+                b += 1
+        return _fromSorted(common)
+
+    # Creates a new set from the difference: self set and setB.
+    def difference(self, setB):
+        listA = self._theElements
+        listB = _sortedElements(setB)
+        remaining = []
+        a = b = 0
+        while a < len(listA) and b < len(listB):
+            if listA[a] < listB[b]:
+                remaining.append(listA[a])
+                a += 1
+            elif listB[b] < listA[a]:
+                b += 1
+            else:
+                a += 1
+                b += 1
+        remaining.extend(listA[a:])
+        return _fromSorted(remaining)
+
+
+# Returns the elements of any set as a sorted list, without copying when the
+# set is already a SortedSet.
+def _sortedElements(theSet):
+    if isinstance(theSet, SortedSet):
+        return theSet._theElements
+    return _unique(sorted(theSet))
+
+# Removes adjacent duplicates from a sorted list.
+def _unique(sortedList):
+    result = []
+    for element in sortedList:
+        if not result or result[-1] != element:
+            result.append(element)
+    return result
+
+# Creates a SortedSet that takes ownership of an already sorted, duplicate-free list.
+def _fromSorted(sortedList):
+    newSet = SortedSet()
+    newSet._theElements = sortedList
+    return newSet
+
+
+if __name__=='__main__':
+    s1 = SortedSet(4, 1, 3)
+    print("Set s1 created with 4, 1, 3 (SortedSet(4, 1, 3)):", s1)
+    s1.add(2)
+    print("Set s1 after adding 2 (s1.add(2)):", s1)
+
+    s2 = SortedSet(3, 4, 5, 6)
+    print("Set s2:", s2)
+
+    print("\nUnion of s1 and s2 (s1 + s2): ", s1 + s2)
+    print("Intersection of s1 and s2 (s1 * s2): ", s1 * s2)
+    print("Difference of s1 and s2 (s1 - s2): ", s1 - s2)
+    print("Is SortedSet(1, 2) a subset of s1 (SortedSet(1, 2) <= s1):", SortedSet(1, 2) <= s1)
+    print("Is s1 equal to SortedSet(1, 2, 3, 4):", s1 == SortedSet(1, 2, 3, 4))
+
+    # Iteration visits the elements in order
+    print("\nIterating over s2 in order:")
+    for element in s2:
+        print("Element:", element)